@@ -18,16 +18,27 @@ from .correlation import (
 from .dashboard import create_alert_rules, create_grafana_dashboard
 from .health import HealthChecker, get_health_checker
 from .integration import (
+    AsyncMonitoringContext,
     MonitoringContext,
+    flush_telemetry,
     monitor_async_mgit_operation,
     monitor_authentication,
     monitor_git_operation,
     monitor_mgit_operation,
     monitor_provider_api_call,
+    set_monitoring_enabled,
+    set_trace_sample_interval,
     setup_monitoring_integration,
 )
 from .logger import StructuredLogger, get_structured_logger, setup_structured_logging
-from .metrics import MetricsCollector, get_metrics_collector, setup_metrics
+from .metrics import (
+    MetricsCollector,
+    disable_metrics,
+    enable_metrics,
+    get_metrics_collector,
+    metrics_enabled,
+    setup_metrics,
+)
 from .performance import PerformanceMonitor, get_performance_monitor
 
 __all__ = [
@@ -43,6 +54,9 @@ __all__ = [
     "MetricsCollector",
     "get_metrics_collector",
     "setup_metrics",
+    "enable_metrics",
+    "disable_metrics",
+    "metrics_enabled",
     "HealthChecker",
     "get_health_checker",
     "PerformanceMonitor",
@@ -50,10 +64,14 @@ __all__ = [
     "create_grafana_dashboard",
     "create_alert_rules",
     "setup_monitoring_integration",
+    "set_monitoring_enabled",
+    "set_trace_sample_interval",
     "monitor_mgit_operation",
     "monitor_async_mgit_operation",
     "monitor_git_operation",
     "monitor_provider_api_call",
     "monitor_authentication",
     "MonitoringContext",
+    "AsyncMonitoringContext",
+    "flush_telemetry",
 ]
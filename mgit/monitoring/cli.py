@@ -189,7 +189,7 @@ def metrics_command(
     metrics = get_metrics_collector()
 
     if format_type.lower() == "json":
-        output = metrics.export_json()
+        output = metrics.export_json(pretty=True)
     else:
         output = metrics.export_prometheus()
 
@@ -4,18 +4,29 @@ This module provides correlation ID functionality to track operations
 across multiple components and log entries.
 """
 
-import threading
 import uuid
 from contextlib import contextmanager
+from contextvars import ContextVar, Token
 from typing import Any, Dict, Optional
 
+# Shared empty context; stored context dicts are never mutated in place
+_EMPTY_CONTEXT: Dict[str, Any] = {}
+
 
 class CorrelationContext:
-    """Thread-local correlation context for request tracing."""
+    """Context-local correlation context for request tracing.
+
+    Data is held in a ContextVar, so every thread and every asyncio task
+    sees its own correlation context. The stored dictionary is replaced
+    rather than modified on each update, which lets scopes restore the
+    previous state by resetting a token.
+    """
 
     def __init__(self):
         """Initialize correlation context."""
-        self._local = threading.local()
+        self._data: ContextVar[Dict[str, Any]] = ContextVar(
+            "mgit_correlation_context", default=_EMPTY_CONTEXT
+        )
 
     def get_correlation_id(self) -> Optional[str]:
         """Get current correlation ID.
@@ -23,20 +34,19 @@ class CorrelationContext:
         Returns:
             Current correlation ID or None if not set
         """
-        return getattr(self._local, "correlation_id", None)
+        return self._data.get().get("correlation_id")
 
     def set_correlation_id(self, correlation_id: str) -> None:
-        """Set correlation ID for current thread.
+        """Set correlation ID for current context.
 
         Args:
             correlation_id: Correlation ID to set
         """
-        self._local.correlation_id = correlation_id
+        self.set_context_data("correlation_id", correlation_id)
 
     def clear_correlation_id(self) -> None:
-        """Clear correlation ID for current thread."""
-        if hasattr(self._local, "correlation_id"):
-            delattr(self._local, "correlation_id")
+        """Clear correlation ID for current context."""
+        self.clear_context_data("correlation_id")
 
     def get_context(self) -> Dict[str, Any]:
         """Get all correlation context data.
@@ -44,16 +54,13 @@ class CorrelationContext:
         Returns:
             Dictionary of correlation context data
         """
-        context = {}
-        correlation_id = self.get_correlation_id()
-        if correlation_id:
-            context["correlation_id"] = correlation_id
-
-        # Add any other context data stored
-        for attr_name in dir(self._local):
-            if not attr_name.startswith("_") and attr_name != "correlation_id":
-                context[attr_name] = getattr(self._local, attr_name)
+        data = self._data.get()
+        if not data:
+            return {}
 
+        context = dict(data)
+        if not context.get("correlation_id"):
+            context.pop("correlation_id", None)
         return context
 
     def set_context_data(self, key: str, value: Any) -> None:
@@ -63,7 +70,9 @@ class CorrelationContext:
             key: Context key
             value: Context value
         """
-        setattr(self._local, key, value)
+        data = dict(self._data.get())
+        data[key] = value
+        self._data.set(data)
 
     def get_context_data(self, key: str, default: Any = None) -> Any:
         """Get context data by key.
@@ -75,7 +84,38 @@ class CorrelationContext:
         Returns:
             Context value or default
         """
-        return getattr(self._local, key, default)
+        return self._data.get().get(key, default)
+
+    def clear_context_data(self, key: str) -> None:
+        """Remove context data by key, if set.
+
+        Args:
+            key: Context key
+        """
+        data = self._data.get()
+        if key in data:
+            data = dict(data)
+            del data[key]
+            self._data.set(data)
+
+    def push(self, context_data: Dict[str, Any]) -> Token:
+        """Layer context data over the current context.
+
+        Args:
+            context_data: Context data to add or override
+
+        Returns:
+            Token that restores the previous context when passed to reset()
+        """
+        return self._data.set({**self._data.get(), **context_data})
+
+    def reset(self, token: Token) -> None:
+        """Restore the context that was current before push().
+
+        Args:
+            token: Token returned by push()
+        """
+        self._data.reset(token)
 
 
 # Global correlation context instance
@@ -92,7 +132,7 @@ def get_correlation_id() -> Optional[str]:
 
 
 def set_correlation_id(correlation_id: Optional[str] = None) -> str:
-    """Set correlation ID for current thread.
+    """Set correlation ID for current context.
 
     Args:
         correlation_id: Correlation ID to set, generates new one if None
@@ -108,7 +148,7 @@ def set_correlation_id(correlation_id: Optional[str] = None) -> str:
 
 
 def clear_correlation_id() -> None:
-    """Clear correlation ID for current thread."""
+    """Clear correlation ID for current context."""
     _correlation_context.clear_correlation_id()
 
 
@@ -144,6 +184,37 @@ def get_context_data(key: str, default: Any = None) -> Any:
     return _correlation_context.get_context_data(key, default)
 
 
+def push_context(
+    context_data: Dict[str, Any], correlation_id: Optional[str] = None
+) -> Token:
+    """Start a correlation scope without a context manager.
+
+    Equivalent to entering correlation_context(correlation_id, **context_data);
+    the scope ends when the returned token is passed to reset_context().
+
+    Args:
+        context_data: Additional context data to set
+        correlation_id: Correlation ID to set, generates new one if None
+
+    Returns:
+        Token for reset_context
+    """
+    if correlation_id is None:
+        correlation_id = str(uuid.uuid4())
+
+    data = _correlation_context._data
+    return data.set({**data.get(), "correlation_id": correlation_id, **context_data})
+
+
+def reset_context(token: Token) -> None:
+    """End a correlation scope started by push_context.
+
+    Args:
+        token: Token returned by push_context
+    """
+    _correlation_context._data.reset(token)
+
+
 @contextmanager
 def correlation_context(correlation_id: Optional[str] = None, **context_data):
     """Context manager for correlation ID and additional context.
@@ -155,36 +226,17 @@ def correlation_context(correlation_id: Optional[str] = None, **context_data):
     Yields:
         The correlation ID
     """
-    # Store previous state
-    previous_correlation_id = get_correlation_id()
-    previous_context = {}
-
+    actual_correlation_id = (
+        str(uuid.uuid4()) if correlation_id is None else correlation_id
+    )
+    token = _correlation_context.push(
+        {"correlation_id": actual_correlation_id, **context_data}
+    )
     try:
-        # Set new correlation ID
-        actual_correlation_id = set_correlation_id(correlation_id)
-
-        # Set additional context data and store previous values
-        for key, value in context_data.items():
-            previous_context[key] = get_context_data(key)
-            set_context_data(key, value)
-
         yield actual_correlation_id
-
     finally:
         # Restore previous state
-        if previous_correlation_id is not None:
-            set_correlation_id(previous_correlation_id)
-        else:
-            clear_correlation_id()
-
-        # Restore previous context data
-        for key, previous_value in previous_context.items():
-            if previous_value is not None:
-                set_context_data(key, previous_value)
-            else:
-                # Clear the context data if it wasn't set before
-                if hasattr(_correlation_context._local, key):
-                    delattr(_correlation_context._local, key)
+        _correlation_context.reset(token)
 
 
 @contextmanager
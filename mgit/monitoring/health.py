@@ -9,14 +9,35 @@ import os
 import socket
 import subprocess
 import tempfile
+import threading
 import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Any, Awaitable, Callable, Dict, Optional
+from functools import cached_property, partial
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
 
 from .logger import get_structured_logger
 from .metrics import get_metrics_collector
 
+# Hosts probed by the network connectivity check
+_TEST_HOSTS: Tuple[Tuple[str, int], ...] = (
+    ("github.com", 443),
+    ("dev.azure.com", 443),
+    ("api.bitbucket.org", 443),
+)
+
+# Provider API endpoints probed by the endpoint check (unauthenticated)
+_PROVIDER_ENDPOINTS: Tuple[Tuple[str, str], ...] = (
+    ("github", "https://api.github.com"),
+    ("azure-devops", "https://dev.azure.com"),
+    ("bitbucket", "https://api.bitbucket.org"),
+)
+
+# Guards creation of HealthChecker's shared probe executor
+_executor_lock = threading.Lock()
+
 
 @dataclass
 class HealthCheckResult:
@@ -29,10 +50,39 @@ class HealthCheckResult:
     duration_ms: float = 0.0
     timestamp: datetime = field(default_factory=datetime.now)
 
+    @cached_property
+    def _payload(self) -> Dict[str, Any]:
+        return {
+            "status": self.status,
+            "message": self.message,
+            "duration_ms": self.duration_ms,
+            "timestamp": self.timestamp.isoformat(),
+            "details": self.details,
+        }
+
+    def to_payload(self) -> Dict[str, Any]:
+        """Render the result for the health report.
+
+        The payload is rendered once per result, so it must only be requested
+        after the check has finished filling in the result. Each caller gets
+        its own copy, so fields added to one report do not leak into others.
+
+        Returns:
+            JSON-serializable dictionary describing the result
+        """
+        return dict(self._payload)
+
 
 class HealthChecker:
     """Comprehensive health check system."""
 
+    # Unchanged check results are only logged once every N runs
+    _LOG_SAMPLE_INTERVAL = 100
+
+    # Shared pool for blocking probes (subprocess, sockets, HTTP)
+    _executor: Optional[ThreadPoolExecutor] = None
+    _executor_workers = 4
+
     def __init__(self):
         """Initialize health checker."""
         self.logger = get_structured_logger("health_checker")
@@ -42,6 +92,7 @@ class HealthChecker:
         self._checks: Dict[str, Callable[[], Awaitable[HealthCheckResult]]] = {}
         self._check_intervals: Dict[str, int] = {}  # seconds
         self._last_results: Dict[str, HealthCheckResult] = {}
+        self._log_counters: Dict[str, int] = {}
 
         # Register default health checks
         self._register_default_checks()
@@ -51,6 +102,9 @@ class HealthChecker:
         self._cache_expiry: Optional[datetime] = None
         self._cache_ttl = 30  # seconds
 
+        # Refresh shared by concurrent callers that miss the cache
+        self._overall_health_task: Optional["asyncio.Future[Dict[str, Any]]"] = None
+
     def _register_default_checks(self) -> None:
         """Register default health checks."""
         self.register_check("system_basics", self._check_system_basics, interval=60)
@@ -105,27 +159,43 @@ class HealthChecker:
             result = await self._checks[name]()
             result.duration_ms = (time.time() - start_time) * 1000
 
-            # Cache result
+            # Cache result, remembering the previous status for log sampling
+            previous = self._last_results.get(name)
             self._last_results[name] = result
 
             # Record metrics
-            self.metrics.set_gauge(
-                "mgit_health_check_status",
-                1.0 if result.status == "healthy" else 0.0,
-                labels={"check": name},
-            )
-            self.metrics.observe_histogram(
-                "mgit_health_check_duration_seconds",
-                result.duration_ms / 1000,
-                labels={"check": name},
+            labels = {"check": name}
+            self.metrics.update_batch(
+                [
+                    (
+                        "gauge",
+                        "mgit_health_check_status",
+                        1.0 if result.status == "healthy" else 0.0,
+                        labels,
+                    ),
+                    (
+                        "histogram",
+                        "mgit_health_check_duration_seconds",
+                        result.duration_ms / 1000,
+                        labels,
+                    ),
+                ]
             )
 
-            self.logger.info(
-                f"Health check '{name}' completed",
-                check_name=name,
-                status=result.status,
-                duration_ms=result.duration_ms,
-            )
+            # Log status transitions, plus a sample of unchanged results
+            log_count = self._log_counters.get(name, 0)
+            self._log_counters[name] = log_count + 1
+            if (
+                previous is None
+                or previous.status != result.status
+                or log_count % self._LOG_SAMPLE_INTERVAL == 0
+            ):
+                self.logger.info(
+                    f"Health check '{name}' completed",
+                    check_name=name,
+                    status=result.status,
+                    duration_ms=result.duration_ms,
+                )
 
             return result
 
@@ -199,6 +269,24 @@ class HealthChecker:
         ):
             return self._overall_health_cache
 
+        # Concurrent callers, e.g. probes arriving together, await one run of
+        # the checks instead of each starting their own
+        task = self._overall_health_task
+        if (
+            task is None
+            or task.done()
+            or task.get_loop() is not asyncio.get_running_loop()
+        ):
+            task = asyncio.ensure_future(self._refresh_overall_health())
+            self._overall_health_task = task
+        return await asyncio.shield(task)
+
+    async def _refresh_overall_health(self) -> Dict[str, Any]:
+        """Run all checks and cache the overall health status.
+
+        Returns:
+            Overall health status dictionary
+        """
         results = await self.run_all_checks()
 
         # Calculate overall status
@@ -226,16 +314,7 @@ class HealthChecker:
                     (healthy_count / total_count * 100) if total_count > 0 else 0
                 ),
             },
-            "checks": {
-                name: {
-                    "status": result.status,
-                    "message": result.message,
-                    "duration_ms": result.duration_ms,
-                    "timestamp": result.timestamp.isoformat(),
-                    "details": result.details,
-                }
-                for name, result in results.items()
-            },
+            "checks": {name: result.to_payload() for name, result in results.items()},
             "issues": unhealthy_checks,
         }
 
@@ -289,6 +368,69 @@ class HealthChecker:
             self.logger.error("Liveness check failed", error=str(e))
             return False
 
+    @classmethod
+    def _get_executor(cls) -> ThreadPoolExecutor:
+        """Get the shared executor used for blocking probes.
+
+        Returns:
+            ThreadPoolExecutor instance
+        """
+        executor = cls._executor
+        if executor is not None:
+            return executor
+
+        # Create under the lock so concurrent first calls share one pool
+        with _executor_lock:
+            if cls._executor is None:
+                cls._executor = ThreadPoolExecutor(
+                    max_workers=cls._executor_workers,
+                    thread_name_prefix="mgit-health",
+                )
+            return cls._executor
+
+    async def _run_blocking(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """Run a blocking call in the shared executor.
+
+        Args:
+            func: Blocking callable
+            *args: Positional arguments for the callable
+            **kwargs: Keyword arguments for the callable
+
+        Returns:
+            Result of the callable
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._get_executor(), partial(func, *args, **kwargs)
+        )
+
+    @staticmethod
+    def _probe_host(host: str, port: int) -> int:
+        """Attempt a TCP connection to a host.
+
+        Returns:
+            Result of connect_ex (0 on success)
+        """
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        try:
+            sock.settimeout(5)
+            return sock.connect_ex((host, port))
+        finally:
+            sock.close()
+
+    @staticmethod
+    def _probe_url(url: str) -> int:
+        """Issue an unauthenticated GET request to a URL.
+
+        Returns:
+            HTTP status code of the response
+        """
+        request = urllib.request.Request(url)
+        request.add_header("User-Agent", "mgit-health-check")
+
+        with urllib.request.urlopen(request, timeout=10) as response:
+            return response.getcode()
+
     # Individual health check implementations
 
     async def _check_system_basics(self) -> HealthCheckResult:
@@ -328,8 +470,12 @@ class HealthChecker:
         """Check if Git is available and working."""
         try:
             # Check if git command is available
-            result = subprocess.run(
-                ["git", "--version"], capture_output=True, text=True, timeout=10
+            result = await self._run_blocking(
+                subprocess.run,
+                ["git", "--version"],
+                capture_output=True,
+                text=True,
+                timeout=10,
             )
 
             if result.returncode == 0:
@@ -370,21 +516,12 @@ class HealthChecker:
 
     async def _check_network_connectivity(self) -> HealthCheckResult:
         """Check basic network connectivity."""
-        test_hosts = [
-            ("github.com", 443),
-            ("dev.azure.com", 443),
-            ("api.bitbucket.org", 443),
-        ]
-
-        results = {}
+        results = dict.fromkeys((host for host, _ in _TEST_HOSTS), None)
         overall_status = "healthy"
 
-        for host, port in test_hosts:
+        for host, port in _TEST_HOSTS:
             try:
-                sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                sock.settimeout(5)
-                result = sock.connect_ex((host, port))
-                sock.close()
+                result = await self._run_blocking(self._probe_host, host, port)
 
                 if result == 0:
                     results[host] = "reachable"
@@ -404,7 +541,7 @@ class HealthChecker:
         return HealthCheckResult(
             name="network_connectivity",
             status=overall_status,
-            message=f"Network connectivity: {reachable_count}/{len(test_hosts)} hosts reachable",
+            message=f"Network connectivity: {reachable_count}/{len(_TEST_HOSTS)} hosts reachable",
             details=results,
         )
 
@@ -512,29 +649,17 @@ class HealthChecker:
     async def _check_provider_endpoints(self) -> HealthCheckResult:
         """Check if provider API endpoints are accessible."""
         # This is a basic connectivity check - not authenticated
-        endpoints = {
-            "github": "https://api.github.com",
-            "azure-devops": "https://dev.azure.com",
-            "bitbucket": "https://api.bitbucket.org",
-        }
-
-        results = {}
+        results = dict.fromkeys((provider for provider, _ in _PROVIDER_ENDPOINTS), None)
         overall_status = "healthy"
 
-        for provider, url in endpoints.items():
+        for provider, url in _PROVIDER_ENDPOINTS:
             try:
-                import urllib.request
-
-                request = urllib.request.Request(url)
-                request.add_header("User-Agent", "mgit-health-check")
-
-                with urllib.request.urlopen(request, timeout=10) as response:
-                    status_code = response.getcode()
-                    if status_code < 400:
-                        results[provider] = "accessible"
-                    else:
-                        results[provider] = f"http_{status_code}"
-                        overall_status = "degraded"
+                status_code = await self._run_blocking(self._probe_url, url)
+                if status_code < 400:
+                    results[provider] = "accessible"
+                else:
+                    results[provider] = f"http_{status_code}"
+                    overall_status = "degraded"
 
             except Exception as e:
                 results[provider] = f"error: {str(e)}"
@@ -550,7 +675,7 @@ class HealthChecker:
         return HealthCheckResult(
             name="provider_endpoints",
             status=overall_status,
-            message=f"Provider endpoints: {accessible_count}/{len(endpoints)} accessible",
+            message=f"Provider endpoints: {accessible_count}/{len(_PROVIDER_ENDPOINTS)} accessible",
             details=results,
         )
 
@@ -4,17 +4,751 @@ This module provides integration decorators and utilities to easily
 add monitoring to existing mgit components.
 """
 
+import asyncio
 import functools
+import inspect
+import itertools
+import logging
 import time
-from typing import Any, Callable, Optional, TypeVar
-
-from .correlation import correlation_context, git_operation_context
-from .logger import get_structured_logger
-from .metrics import get_metrics_collector
-from .performance import get_performance_monitor
+import types
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar
+
+from .correlation import push_context, reset_context
+from .logger import (
+    StructuredLogger,
+    flush_queue_logging,
+    get_structured_logger,
+    setup_structured_logging,
+    start_queue_logging,
+)
+from .metrics import MetricsCollector, get_metrics_collector, setup_metrics
+from .performance import PerformanceMonitor, get_performance_monitor
 
 T = TypeVar("T")
 
+# Durations only need a monotonic clock; bind it once for the wrappers below
+_pc = time.perf_counter_ns
+
+# Checked when a function is decorated; when off the decorators hand back the
+# original function so disabled monitoring costs nothing per call
+_MONITORING_ENABLED = True
+
+# Set once setup_monitoring_integration has initialized logging and metrics
+_initialized = False
+
+# True while an operation wrapper is running. Monitored calls nested inside
+# it only record their metrics; the outer call already holds the trace,
+# correlation scope and start/end logs.
+_in_monitored_call: ContextVar[bool] = ContextVar(
+    "mgit_in_monitored_call", default=False
+)
+
+
+def set_monitoring_enabled(enabled: bool) -> None:
+    """Enable or disable monitoring for functions decorated from now on.
+
+    Functions that were already decorated keep their current behaviour, so
+    this should be called before the modules using the decorators are
+    imported.
+
+    Args:
+        enabled: Whether the monitoring decorators should wrap functions
+    """
+    global _MONITORING_ENABLED
+    _MONITORING_ENABLED = enabled
+
+
+# Decorated calls record a performance trace for one call in every
+# _TRACE_SAMPLE_MASK + 1, whether it succeeds or fails, so trace statistics
+# such as success rates stay unbiased. Every call is traced by default.
+# Counters and histograms are recorded for every call regardless.
+_TRACE_SAMPLE_MASK = 0
+_trace_counter = itertools.count()
+
+
+def set_trace_sample_interval(interval: int) -> None:
+    """Set how often decorated calls record a performance trace.
+
+    Sampling lowers the tracing overhead of long-running processes. Success
+    rates and duration percentiles from the performance monitor remain
+    representative, while its operation counts cover only the sampled calls.
+
+    Args:
+        interval: Trace one call in every ``interval``; must be a power of
+            two, 1 traces every call
+
+    Raises:
+        ValueError: If interval is not a positive power of two
+    """
+    global _TRACE_SAMPLE_MASK
+    if interval < 1 or interval & (interval - 1):
+        raise ValueError(f"Trace sample interval must be a power of two: {interval}")
+    _TRACE_SAMPLE_MASK = interval - 1
+
+
+def _trace_sampled() -> bool:
+    """Return whether the current decorated call should be traced."""
+    return not next(_trace_counter) & _TRACE_SAMPLE_MASK
+
+
+def _complete_operation(
+    logger: StructuredLogger,
+    metrics: MetricsCollector,
+    performance_monitor: PerformanceMonitor,
+    operation_name: str,
+    provider: Optional[str],
+    duration: float,
+    operation_id: Optional[str],
+    log_result: bool,
+    error: Optional[BaseException] = None,
+) -> None:
+    """Record the outcome of a monitored operation.
+
+    Metrics, the performance trace and the operation log are all updated
+    from this single call so the decorators and MonitoringContext share one
+    completion path.
+
+    Args:
+        logger: Structured logger for the operation
+        metrics: Metrics collector
+        performance_monitor: Performance monitor holding the trace
+        operation_name: Name of the operation
+        provider: Provider name, if any
+        duration: Operation duration in seconds
+        operation_id: Performance trace ID, if the operation is traced
+        log_result: Whether to log the operation result
+        error: Exception raised by the operation, if it failed
+    """
+    if error is None:
+        metrics.record_operation_result(operation_name, True, duration, provider)
+        if operation_id:
+            performance_monitor.end_trace(operation_id, success=True)
+        if log_result:
+            logger.operation_end(operation_name, success=True, duration=duration)
+        return
+
+    # The exception is rendered once and the text shared by every consumer
+    error_type = type(error).__name__
+    error_message = str(error)
+
+    metrics.record_operation_result(
+        operation_name, False, duration, provider, error_type=error_type
+    )
+
+    if operation_id:
+        performance_monitor.end_trace(operation_id, success=False, error=error_message)
+
+    if log_result:
+        logger.operation_end(operation_name, success=False, duration=duration)
+        if logger.isEnabledFor(logging.ERROR):
+            logger.error(
+                "Operation %s failed: %s",
+                operation_name,
+                error_message,
+                error=error_message,
+                error_type=error_type,
+            )
+
+
+# Parameter names the git decorator reports as the operation's repository
+_REPOSITORY_PARAMS = ("repository", "repo_url", "url")
+
+
+def _find_repository_param(
+    func: Callable[..., Any],
+) -> Tuple[Optional[int], Optional[str]]:
+    """Locate the repository parameter of a git operation.
+
+    Args:
+        func: Function being decorated
+
+    Returns:
+        Tuple of the parameter's positional index (None if it is keyword-only)
+        and its name, or (None, None) if the function has no such parameter
+    """
+    try:
+        parameters = inspect.signature(func).parameters.values()
+    except (TypeError, ValueError):
+        return None, None
+
+    positional = (
+        inspect.Parameter.POSITIONAL_ONLY,
+        inspect.Parameter.POSITIONAL_OR_KEYWORD,
+    )
+    for index, parameter in enumerate(parameters):
+        if parameter.name in _REPOSITORY_PARAMS:
+            if parameter.kind in positional:
+                return index, parameter.name
+            return None, parameter.name
+    return None, None
+
+
+class _Monitored:
+    """Base for the callables returned by the monitoring decorators.
+
+    Everything a wrapper needs is captured once at decoration time and kept
+    in slots, so each call reads it with a plain attribute load on ``self``
+    instead of dereferencing closure cells.
+    """
+
+    __slots__ = ("func", "logger", "metrics", "perf", "__dict__")
+
+    def __init__(
+        self,
+        func: Callable[..., Any],
+        logger: StructuredLogger,
+        metrics: MetricsCollector,
+        perf: PerformanceMonitor,
+    ):
+        self.func = func
+        self.logger = logger
+        self.metrics = metrics
+        self.perf = perf
+        functools.update_wrapper(self, func)
+
+    def __get__(self, instance: Any, owner: Optional[type] = None) -> Any:
+        # Bind like a plain function so decorated methods still receive self
+        if instance is None:
+            return self
+        return types.MethodType(self, instance)
+
+
+def _class_provider_name(cls: type) -> Optional[str]:
+    """Get the provider name a class defines as a plain string attribute.
+
+    Args:
+        cls: Type of the first argument of a monitored call
+
+    Returns:
+        The class-level provider_name, or None if it is missing, not a string
+        or computed by a descriptor such as a property
+    """
+    value = inspect.getattr_static(cls, "provider_name", None)
+    return value if isinstance(value, str) else None
+
+
+class _MonitoredProvider(_Monitored):
+    """Base for wrappers that report the provider a call was made for."""
+
+    __slots__ = ("provider", "class_providers")
+
+    def __init__(
+        self,
+        func: Callable[..., Any],
+        logger: StructuredLogger,
+        metrics: MetricsCollector,
+        perf: PerformanceMonitor,
+        provider: Optional[str],
+    ):
+        super().__init__(func, logger, metrics, perf)
+        self.provider = provider
+        # Class-level provider names by type of the first argument
+        self.class_providers: Dict[type, Optional[str]] = {}
+
+    def _provider_for(self, args: Tuple[Any, ...]) -> Optional[str]:
+        """Get the provider to report for a call.
+
+        Without a configured provider, the first argument's provider_name is
+        reported. A name defined on its class is resolved once per type;
+        names set on instances or computed by properties are read per call.
+
+        Args:
+            args: Positional arguments of the call
+
+        Returns:
+            Provider name, or None if it is unknown
+        """
+        provider = self.provider
+        if provider or not args:
+            return provider
+        instance = args[0]
+        cls = type(instance)
+        try:
+            provider = self.class_providers[cls]
+        except KeyError:
+            provider = self.class_providers[cls] = _class_provider_name(cls)
+        if provider is None:
+            provider = getattr(instance, "provider_name", None)
+        return provider
+
+
+class _MonitoredSync(_Monitored):
+    """Wrapper installed by monitor_mgit_operation."""
+
+    __slots__ = (
+        "name",
+        "provider",
+        "track",
+        "log",
+        "context",
+        "tags",
+        "start_trace",
+        "operation_start",
+        "record_result",
+    )
+
+    def __init__(
+        self,
+        func: Callable[..., Any],
+        logger: StructuredLogger,
+        metrics: MetricsCollector,
+        perf: PerformanceMonitor,
+        *,
+        name: Optional[str],
+        provider: Optional[str],
+        track: bool,
+        log: bool,
+    ):
+        super().__init__(func, logger, metrics, perf)
+        self.name = name = name or func.__name__
+        self.provider = provider
+        self.track = track
+        self.log = log
+
+        # Hot-path collaborator methods are bound once here rather than
+        # looked up on the logger and monitor on every call
+        self.start_trace = perf.start_trace
+        self.operation_start = logger.operation_start
+        self.record_result = metrics.record_operation_result
+
+        # The correlation data and trace tags only depend on the decorator
+        # arguments, so build them once instead of on every call
+        self.context = {"operation": name}
+        self.tags = None
+        if provider:
+            self.context["provider"] = provider
+            self.tags = {"provider": provider}
+
+    def _start(self) -> Optional[str]:
+        """Open the performance trace and log the start of the operation.
+
+        Returns:
+            Performance trace ID, or None if the call is not traced
+        """
+        operation_id = None
+        if self.track and _trace_sampled():
+            operation_id = self.start_trace(self.name, tags=self.tags)
+        if self.log:
+            self.operation_start(self.name, provider=self.provider)
+        return operation_id
+
+    def _finish(
+        self,
+        start_ns: int,
+        operation_id: Optional[str],
+        error: Optional[BaseException] = None,
+    ) -> None:
+        """Record the outcome of one call.
+
+        Args:
+            start_ns: perf_counter_ns value taken when the call started
+            operation_id: Performance trace ID returned by _start, if sampled
+            error: Exception raised by the operation, if it failed
+        """
+        _complete_operation(
+            self.logger,
+            self.metrics,
+            self.perf,
+            self.name,
+            self.provider,
+            (_pc() - start_ns) * 1e-9,
+            operation_id,
+            self.log,
+            error=error,
+        )
+
+    def _finish_nested(
+        self, start_ns: int, error: Optional[BaseException] = None
+    ) -> None:
+        """Record the metrics of a call nested in another monitored call.
+
+        Args:
+            start_ns: perf_counter_ns value taken when the call started
+            error: Exception raised by the operation, if it failed
+        """
+        self.record_result(
+            self.name,
+            error is None,
+            (_pc() - start_ns) * 1e-9,
+            self.provider,
+            error_type=None if error is None else type(error).__name__,
+        )
+
+    def __call__(self, *args, **kwargs) -> Any:
+        start_ns = _pc()
+        if _in_monitored_call.get():
+            try:
+                result = self.func(*args, **kwargs)
+            except Exception as e:
+                self._finish_nested(start_ns, e)
+                raise
+            self._finish_nested(start_ns)
+            return result
+
+        token = push_context(self.context)
+        outer = _in_monitored_call.set(True)
+        try:
+            operation_id = self._start()
+            try:
+                result = self.func(*args, **kwargs)
+            except Exception as e:
+                self._finish(start_ns, operation_id, e)
+                raise
+            self._finish(start_ns, operation_id)
+            return result
+        finally:
+            _in_monitored_call.reset(outer)
+            reset_context(token)
+
+
+class _MonitoredAsync(_MonitoredSync):
+    """Wrapper installed by monitor_async_mgit_operation."""
+
+    __slots__ = ()
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Keep the wrapper recognisable as a coroutine function
+        if hasattr(inspect, "markcoroutinefunction"):
+            inspect.markcoroutinefunction(self)
+
+    async def __call__(self, *args, **kwargs) -> Any:
+        start_ns = _pc()
+        if _in_monitored_call.get():
+            try:
+                result = await self.func(*args, **kwargs)
+            except Exception as e:
+                self._finish_nested(start_ns, e)
+                raise
+            self._finish_nested(start_ns)
+            return result
+
+        token = push_context(self.context)
+        outer = _in_monitored_call.set(True)
+        try:
+            operation_id = self._start()
+            try:
+                result = await self.func(*args, **kwargs)
+            except Exception as e:
+                self._finish(start_ns, operation_id, e)
+                raise
+            self._finish(start_ns, operation_id)
+            return result
+        finally:
+            _in_monitored_call.reset(outer)
+            reset_context(token)
+
+
+class _MonitoredGit(_Monitored):
+    """Wrapper installed by monitor_git_operation."""
+
+    __slots__ = (
+        "op_type",
+        "track",
+        "repo_index",
+        "repo_param",
+        "context",
+        "start_trace",
+        "end_trace",
+        "operation_start",
+        "git_operation",
+        "record_git_operation",
+    )
+
+    def __init__(
+        self,
+        func: Callable[..., Any],
+        logger: StructuredLogger,
+        metrics: MetricsCollector,
+        perf: PerformanceMonitor,
+        *,
+        op_type: Optional[str],
+        track: bool,
+    ):
+        super().__init__(func, logger, metrics, perf)
+        self.op_type = op_type or func.__name__.replace("git_", "")
+        self.track = track
+        self.repo_index, self.repo_param = _find_repository_param(func)
+        self.context = {"git_operation": self.op_type}
+        self.start_trace = perf.start_trace
+        self.end_trace = perf.end_trace
+        self.operation_start = logger.operation_start
+        self.git_operation = logger.git_operation
+        self.record_git_operation = metrics.record_git_operation
+
+    def _finish(
+        self,
+        repository: Optional[str],
+        start_ns: int,
+        operation_id: Optional[str],
+        error: Optional[BaseException] = None,
+        nested: bool = False,
+    ) -> None:
+        """Record the outcome of one git operation.
+
+        Args:
+            repository: Repository the operation ran against, if known
+            start_ns: perf_counter_ns value taken when the call started
+            operation_id: Performance trace ID, if the call was sampled
+            error: Exception raised by the operation, if it failed
+            nested: Whether the call ran inside another monitored call, in
+                which case only its metrics are recorded
+        """
+        op_type = self.op_type
+        success = error is None
+
+        repository = repository or "unknown"
+
+        self.record_git_operation(
+            operation=op_type,
+            repository=repository,
+            success=success,
+            duration=(_pc() - start_ns) * 1e-9,
+        )
+        if nested:
+            return
+
+        if success:
+            if operation_id:
+                self.end_trace(operation_id, success=True)
+            self.git_operation(op_type, repository, success=True)
+            return
+
+        error_message = str(error)
+        if operation_id:
+            self.end_trace(operation_id, success=False, error=error_message)
+
+        self.git_operation(op_type, repository, success=False)
+        if self.logger.isEnabledFor(logging.ERROR):
+            self.logger.error(
+                "Git %s failed: %s",
+                op_type,
+                error_message,
+                error=error_message,
+                error_type=type(error).__name__,
+            )
+
+    def __call__(self, *args, **kwargs) -> Any:
+        op_type = self.op_type
+
+        # Extract repository from the parameter found at decoration time
+        repo_index = self.repo_index
+        if repo_index is not None and len(args) > repo_index:
+            repository = args[repo_index]
+        else:
+            repository = kwargs.get(self.repo_param) if self.repo_param else None
+
+        if _in_monitored_call.get():
+            start_ns = _pc()
+            try:
+                result = self.func(*args, **kwargs)
+            except Exception as e:
+                self._finish(repository, start_ns, None, e, nested=True)
+                raise
+            self._finish(repository, start_ns, None, nested=True)
+            return result
+
+        context = self.context
+        if repository:
+            context = {**context, "repository": repository}
+
+        token = push_context(context)
+        outer = _in_monitored_call.set(True)
+        try:
+            operation_id = None
+            if self.track and _trace_sampled():
+                operation_id = self.start_trace(
+                    f"git_{op_type}",
+                    tags={"repository": repository} if repository else None,
+                )
+
+            start_ns = _pc()
+            self.operation_start(f"git_{op_type}", repository=repository)
+            try:
+                result = self.func(*args, **kwargs)
+            except Exception as e:
+                self._finish(repository, start_ns, operation_id, e)
+                raise
+            self._finish(repository, start_ns, operation_id)
+            return result
+        finally:
+            _in_monitored_call.reset(outer)
+            reset_context(token)
+
+
+class _MonitoredApi(_MonitoredProvider):
+    """Wrapper installed by monitor_provider_api_call."""
+
+    __slots__ = ("endpoint", "api_call", "record_api_call")
+
+    def __init__(
+        self,
+        func: Callable[..., Any],
+        logger: StructuredLogger,
+        metrics: MetricsCollector,
+        perf: PerformanceMonitor,
+        *,
+        provider: Optional[str],
+        endpoint: Optional[str],
+    ):
+        super().__init__(func, logger, metrics, perf, provider)
+        self.endpoint = endpoint
+        self.api_call = logger.api_call
+        self.record_api_call = metrics.record_api_call
+
+    def _finish(
+        self,
+        provider: Optional[str],
+        start_ns: int,
+        error: Optional[BaseException] = None,
+        nested: bool = False,
+    ) -> None:
+        """Record the outcome of one API call.
+
+        Success is assumed when no exception was raised; failures are
+        reported as server errors.
+
+        Args:
+            provider: Provider the call was made to, if known
+            start_ns: perf_counter_ns value taken when the call started
+            error: Exception raised by the call, if it failed
+            nested: Whether the call ran inside a monitored operation, in
+                which case only its metrics are recorded
+        """
+        endpoint = self.endpoint
+        status_code = 200 if error is None else 500
+        duration = (_pc() - start_ns) * 1e-9
+
+        if provider:
+            self.record_api_call(
+                method="GET",  # Default method
+                provider=provider,
+                status_code=status_code,
+                duration=duration,
+                endpoint=endpoint,
+            )
+        if nested:
+            return
+
+        self.api_call(
+            method="API",
+            url=endpoint or f"{provider}_api",
+            status_code=status_code,
+            response_time=duration,
+        )
+        if error is not None:
+            self.logger.error("API call to %s failed: %s", provider, error)
+
+    def __call__(self, *args, **kwargs) -> Any:
+        provider = self._provider_for(args)
+        nested = _in_monitored_call.get()
+        start_ns = _pc()
+        try:
+            result = self.func(*args, **kwargs)
+        except Exception as e:
+            self._finish(provider, start_ns, e, nested)
+            raise
+        self._finish(provider, start_ns, None, nested)
+        return result
+
+
+class _MonitoredAuth(_MonitoredProvider):
+    """Wrapper installed by monitor_authentication."""
+
+    __slots__ = ("authentication", "record_authentication")
+
+    def __init__(
+        self,
+        func: Callable[..., Any],
+        logger: StructuredLogger,
+        metrics: MetricsCollector,
+        perf: PerformanceMonitor,
+        *,
+        provider: Optional[str],
+    ):
+        super().__init__(func, logger, metrics, perf, provider)
+        self.authentication = logger.authentication
+        self.record_authentication = metrics.record_authentication
+
+    def _finish(
+        self,
+        provider: Optional[str],
+        organization: Optional[str],
+        error: Optional[BaseException] = None,
+        nested: bool = False,
+    ) -> None:
+        """Record the outcome of one authentication attempt.
+
+        Args:
+            provider: Provider authenticated against, if known
+            organization: Organization authenticated against, if known
+            error: Exception raised by the attempt, if it failed
+            nested: Whether the attempt ran inside a monitored operation, in
+                which case only its metrics are recorded
+        """
+        success = error is None
+        organization = organization or "unknown"
+
+        if provider:
+            self.record_authentication(
+                provider=provider, organization=organization, success=success
+            )
+        if nested:
+            return
+
+        self.authentication(
+            provider=provider or "unknown", organization=organization, success=success
+        )
+        if not success:
+            self.logger.error("Authentication failed for %s: %s", provider, error)
+
+    def __call__(self, *args, **kwargs) -> Any:
+        provider = self._provider_for(args)
+        organization = kwargs.get("organization") or kwargs.get("org")
+        nested = _in_monitored_call.get()
+        try:
+            result = self.func(*args, **kwargs)
+        except Exception as e:
+            self._finish(provider, organization, e, nested)
+            raise
+        self._finish(provider, organization, None, nested)
+        return result
+
+
+_WRAPPER_TYPES = {
+    "mgit": _MonitoredSync,
+    "async": _MonitoredAsync,
+    "git": _MonitoredGit,
+    "api": _MonitoredApi,
+    "auth": _MonitoredAuth,
+}
+
+
+def _make_wrapper(
+    func: Callable[..., Any], *, kind: str, logger_name: str, **options: Any
+) -> Callable[..., Any]:
+    """Build the monitoring wrapper shared by the public decorators.
+
+    Args:
+        func: Function being decorated
+        kind: Wrapper type, one of the keys of _WRAPPER_TYPES
+        logger_name: Name of the structured logger the wrapper reports to
+        **options: Decorator arguments forwarded to the wrapper type
+
+    Returns:
+        The monitoring wrapper, or func itself when monitoring is disabled
+    """
+    if not _MONITORING_ENABLED:
+        return func
+    return _WRAPPER_TYPES[kind](
+        func,
+        get_structured_logger(logger_name),
+        get_metrics_collector(),
+        get_performance_monitor(),
+        **options,
+    )
+
 
 def monitor_mgit_operation(
     operation_name: Optional[str] = None,
@@ -32,99 +766,15 @@ def monitor_mgit_operation(
     """
 
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
-        actual_operation_name = operation_name or func.__name__
-        logger = get_structured_logger(f"mgit.{func.__module__}")
-        metrics = get_metrics_collector()
-        performance_monitor = get_performance_monitor()
-
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs) -> T:
-            # Set up correlation context
-            context_data = {}
-            if provider:
-                context_data["provider"] = provider
-
-            with correlation_context(operation=actual_operation_name, **context_data):
-                # Start performance tracking
-                operation_id = None
-                if track_performance:
-                    operation_id = performance_monitor.start_trace(
-                        actual_operation_name,
-                        tags={"provider": provider} if provider else None,
-                    )
-
-                start_time = time.time()
-
-                try:
-                    # Log operation start
-                    if log_result:
-                        logger.operation_start(actual_operation_name, provider=provider)
-
-                    # Execute operation
-                    result = func(*args, **kwargs)
-
-                    # Calculate duration
-                    duration = time.time() - start_time
-
-                    # Record metrics
-                    metrics.record_operation(
-                        operation=actual_operation_name,
-                        success=True,
-                        duration=duration,
-                        provider=provider,
-                    )
-
-                    # End performance tracking
-                    if track_performance and operation_id:
-                        performance_monitor.end_trace(operation_id, success=True)
-
-                    # Log operation success
-                    if log_result:
-                        logger.operation_end(
-                            actual_operation_name, success=True, duration=duration
-                        )
-
-                    return result
-
-                except Exception as e:
-                    # Calculate duration
-                    duration = time.time() - start_time
-
-                    # Record metrics
-                    metrics.record_operation(
-                        operation=actual_operation_name,
-                        success=False,
-                        duration=duration,
-                        provider=provider,
-                    )
-
-                    # Record error
-                    metrics.record_error(
-                        error_type=type(e).__name__,
-                        operation=actual_operation_name,
-                        provider=provider,
-                    )
-
-                    # End performance tracking
-                    if track_performance and operation_id:
-                        performance_monitor.end_trace(
-                            operation_id, success=False, error=str(e)
-                        )
-
-                    # Log operation failure
-                    if log_result:
-                        logger.operation_end(
-                            actual_operation_name, success=False, duration=duration
-                        )
-                        logger.error(
-                            f"Operation {actual_operation_name} failed: {str(e)}",
-                            error=str(e),
-                            error_type=type(e).__name__,
-                        )
-
-                    raise
-
-        return wrapper
+        return _make_wrapper(
+            func,
+            kind="mgit",
+            logger_name=f"mgit.{func.__module__}",
+            name=operation_name,
+            provider=provider,
+            track=track_performance,
+            log=log_result,
+        )
 
     return decorator
 
@@ -145,99 +795,15 @@ def monitor_async_mgit_operation(
     """
 
     def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
-        actual_operation_name = operation_name or func.__name__
-        logger = get_structured_logger(f"mgit.{func.__module__}")
-        metrics = get_metrics_collector()
-        performance_monitor = get_performance_monitor()
-
-        @functools.wraps(func)
-        async def wrapper(*args, **kwargs) -> Any:
-            # Set up correlation context
-            context_data = {}
-            if provider:
-                context_data["provider"] = provider
-
-            with correlation_context(operation=actual_operation_name, **context_data):
-                # Start performance tracking
-                operation_id = None
-                if track_performance:
-                    operation_id = performance_monitor.start_trace(
-                        actual_operation_name,
-                        tags={"provider": provider} if provider else None,
-                    )
-
-                start_time = time.time()
-
-                try:
-                    # Log operation start
-                    if log_result:
-                        logger.operation_start(actual_operation_name, provider=provider)
-
-                    # Execute operation
-                    result = await func(*args, **kwargs)
-
-                    # Calculate duration
-                    duration = time.time() - start_time
-
-                    # Record metrics
-                    metrics.record_operation(
-                        operation=actual_operation_name,
-                        success=True,
-                        duration=duration,
-                        provider=provider,
-                    )
-
-                    # End performance tracking
-                    if track_performance and operation_id:
-                        performance_monitor.end_trace(operation_id, success=True)
-
-                    # Log operation success
-                    if log_result:
-                        logger.operation_end(
-                            actual_operation_name, success=True, duration=duration
-                        )
-
-                    return result
-
-                except Exception as e:
-                    # Calculate duration
-                    duration = time.time() - start_time
-
-                    # Record metrics
-                    metrics.record_operation(
-                        operation=actual_operation_name,
-                        success=False,
-                        duration=duration,
-                        provider=provider,
-                    )
-
-                    # Record error
-                    metrics.record_error(
-                        error_type=type(e).__name__,
-                        operation=actual_operation_name,
-                        provider=provider,
-                    )
-
-                    # End performance tracking
-                    if track_performance and operation_id:
-                        performance_monitor.end_trace(
-                            operation_id, success=False, error=str(e)
-                        )
-
-                    # Log operation failure
-                    if log_result:
-                        logger.operation_end(
-                            actual_operation_name, success=False, duration=duration
-                        )
-                        logger.error(
-                            f"Operation {actual_operation_name} failed: {str(e)}",
-                            error=str(e),
-                            error_type=type(e).__name__,
-                        )
-
-                    raise
-
-        return wrapper
+        return _make_wrapper(
+            func,
+            kind="async",
+            logger_name=f"mgit.{func.__module__}",
+            name=operation_name,
+            provider=provider,
+            track=track_performance,
+            log=log_result,
+        )
 
     return decorator
 
@@ -253,101 +819,13 @@ def monitor_git_operation(
     """
 
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
-        actual_operation_type = operation_type or func.__name__.replace("git_", "")
-        logger = get_structured_logger("mgit.git")
-        metrics = get_metrics_collector()
-        performance_monitor = get_performance_monitor()
-
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs) -> T:
-            # Try to extract repository from arguments
-            repository = None
-            if args:
-                # Check if first argument looks like a repository URL or name
-                if isinstance(args[0], str) and ("/" in args[0] or ".git" in args[0]):
-                    repository = args[0]
-
-            # Look for repository in kwargs
-            if not repository:
-                repository = (
-                    kwargs.get("repository")
-                    or kwargs.get("repo_url")
-                    or kwargs.get("url")
-                )
-
-            with git_operation_context(actual_operation_type, repository=repository):
-                # Start performance tracking
-                operation_id = None
-                if track_performance:
-                    operation_id = performance_monitor.start_trace(
-                        f"git_{actual_operation_type}",
-                        tags={"repository": repository} if repository else None,
-                    )
-
-                start_time = time.time()
-
-                try:
-                    # Log operation start
-                    logger.operation_start(
-                        f"git_{actual_operation_type}", repository=repository
-                    )
-
-                    # Execute operation
-                    result = func(*args, **kwargs)
-
-                    # Calculate duration
-                    duration = time.time() - start_time
-
-                    # Record Git-specific metrics
-                    metrics.record_git_operation(
-                        operation=actual_operation_type,
-                        repository=repository or "unknown",
-                        success=True,
-                        duration=duration,
-                    )
-
-                    # End performance tracking
-                    if track_performance and operation_id:
-                        performance_monitor.end_trace(operation_id, success=True)
-
-                    # Log operation success
-                    logger.git_operation(
-                        actual_operation_type, repository or "unknown", success=True
-                    )
-
-                    return result
-
-                except Exception as e:
-                    # Calculate duration
-                    duration = time.time() - start_time
-
-                    # Record Git-specific metrics
-                    metrics.record_git_operation(
-                        operation=actual_operation_type,
-                        repository=repository or "unknown",
-                        success=False,
-                        duration=duration,
-                    )
-
-                    # End performance tracking
-                    if track_performance and operation_id:
-                        performance_monitor.end_trace(
-                            operation_id, success=False, error=str(e)
-                        )
-
-                    # Log operation failure
-                    logger.git_operation(
-                        actual_operation_type, repository or "unknown", success=False
-                    )
-                    logger.error(
-                        f"Git {actual_operation_type} failed: {str(e)}",
-                        error=str(e),
-                        error_type=type(e).__name__,
-                    )
-
-                    raise
-
-        return wrapper
+        return _make_wrapper(
+            func,
+            kind="git",
+            logger_name="mgit.git",
+            op_type=operation_type,
+            track=track_performance,
+        )
 
     return decorator
 
@@ -363,71 +841,13 @@ def monitor_provider_api_call(
     """
 
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
-        logger = get_structured_logger("mgit.providers")
-        metrics = get_metrics_collector()
-
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs) -> T:
-            # Extract provider from args/kwargs if not specified
-            actual_provider = provider_name
-            if not actual_provider and args and hasattr(args[0], "provider_name"):
-                actual_provider = args[0].provider_name
-
-            start_time = time.time()
-
-            try:
-                # Execute API call
-                result = func(*args, **kwargs)
-
-                # Calculate duration
-                duration = time.time() - start_time
-
-                # Record API call metrics (assuming success if no exception)
-                if actual_provider:
-                    metrics.record_api_call(
-                        method="GET",  # Default method
-                        provider=actual_provider,
-                        status_code=200,  # Assume success
-                        duration=duration,
-                        endpoint=endpoint,
-                    )
-
-                # Log API call
-                logger.api_call(
-                    method="API",
-                    url=endpoint or f"{actual_provider}_api",
-                    status_code=200,
-                    response_time=duration,
-                )
-
-                return result
-
-            except Exception as e:
-                # Calculate duration
-                duration = time.time() - start_time
-
-                # Record API call metrics (failure)
-                if actual_provider:
-                    metrics.record_api_call(
-                        method="GET",
-                        provider=actual_provider,
-                        status_code=500,  # Assume server error
-                        duration=duration,
-                        endpoint=endpoint,
-                    )
-
-                # Log API call failure
-                logger.api_call(
-                    method="API",
-                    url=endpoint or f"{actual_provider}_api",
-                    status_code=500,
-                    response_time=duration,
-                )
-                logger.error(f"API call to {actual_provider} failed: {str(e)}")
-
-                raise
-
-        return wrapper
+        return _make_wrapper(
+            func,
+            kind="api",
+            logger_name="mgit.providers",
+            provider=provider_name,
+            endpoint=endpoint,
+        )
 
     return decorator
 
@@ -440,62 +860,9 @@ def monitor_authentication(provider_name: Optional[str] = None):
     """
 
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
-        logger = get_structured_logger("mgit.auth")
-        metrics = get_metrics_collector()
-
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs) -> T:
-            # Extract provider and organization from args/kwargs
-            actual_provider = provider_name
-            organization = None
-
-            if not actual_provider and args and hasattr(args[0], "provider_name"):
-                actual_provider = args[0].provider_name
-
-            # Look for organization in kwargs
-            organization = kwargs.get("organization") or kwargs.get("org")
-
-            try:
-                # Execute authentication
-                result = func(*args, **kwargs)
-
-                # Record successful authentication
-                if actual_provider:
-                    metrics.record_authentication(
-                        provider=actual_provider,
-                        organization=organization or "unknown",
-                        success=True,
-                    )
-
-                # Log authentication success
-                logger.authentication(
-                    provider=actual_provider or "unknown",
-                    organization=organization or "unknown",
-                    success=True,
-                )
-
-                return result
-
-            except Exception as e:
-                # Record failed authentication
-                if actual_provider:
-                    metrics.record_authentication(
-                        provider=actual_provider,
-                        organization=organization or "unknown",
-                        success=False,
-                    )
-
-                # Log authentication failure
-                logger.authentication(
-                    provider=actual_provider or "unknown",
-                    organization=organization or "unknown",
-                    success=False,
-                )
-                logger.error(f"Authentication failed for {actual_provider}: {str(e)}")
-
-                raise
-
-        return wrapper
+        return _make_wrapper(
+            func, kind="auth", logger_name="mgit.auth", provider=provider_name
+        )
 
     return decorator
 
@@ -526,23 +893,26 @@ class MonitoringContext:
         self.logger = get_structured_logger("mgit.context")
         self.metrics = get_metrics_collector()
         self.performance_monitor = get_performance_monitor()
+        self._record_result = self.metrics.record_operation_result
+        self._end_trace = self.performance_monitor.end_trace
+        self._operation_end = self.logger.operation_end
+
+        self.tags: Dict[str, str] = {}
+        if provider:
+            self.tags["provider"] = provider
+        if repository:
+            self.tags["repository"] = repository
 
         self.operation_id = None
-        self.start_time = None
+        self._start_ns: Optional[int] = None
 
     def __enter__(self):
         """Enter monitoring context."""
-        self.start_time = time.time()
+        self._start_ns = _pc()
 
         # Start performance tracking
-        tags = {}
-        if self.provider:
-            tags["provider"] = self.provider
-        if self.repository:
-            tags["repository"] = self.repository
-
         self.operation_id = self.performance_monitor.start_trace(
-            self.operation_name, tags=tags, metadata=self.metadata
+            self.operation_name, tags=self.tags, metadata=self.metadata
         )
 
         # Log operation start
@@ -557,54 +927,124 @@ class MonitoringContext:
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Exit monitoring context."""
-        duration = time.time() - self.start_time if self.start_time else 0
-        success = exc_type is None
+        duration = (_pc() - self._start_ns) * 1e-9 if self._start_ns is not None else 0
 
-        # Record metrics
-        self.metrics.record_operation(
-            operation=self.operation_name,
-            success=success,
-            duration=duration,
-            provider=self.provider,
-        )
+        if exc_type is None:
+            self._exit_success(duration)
+        else:
+            self._exit_failure(exc_val, duration)
 
-        if not success:
-            self.metrics.record_error(
-                error_type=exc_type.__name__ if exc_type else "unknown",
-                operation=self.operation_name,
-                provider=self.provider,
-            )
+    def _exit_success(self, duration: float) -> None:
+        """Record a successful exit.
 
-        # End performance tracking
+        Args:
+            duration: Operation duration in seconds
+        """
+        self._record_result(self.operation_name, True, duration, self.provider)
         if self.operation_id:
-            self.performance_monitor.end_trace(
-                self.operation_id,
-                success=success,
-                error=str(exc_val) if exc_val else None,
-            )
+            self._end_trace(self.operation_id, success=True)
+        self._operation_end(self.operation_name, success=True, duration=duration)
 
-        # Log operation end
-        self.logger.operation_end(
-            self.operation_name, success=success, duration=duration
+    def _exit_failure(self, error: BaseException, duration: float) -> None:
+        """Record an exit caused by an exception.
+
+        Args:
+            error: Exception that ended the operation
+            duration: Operation duration in seconds
+        """
+        _complete_operation(
+            self.logger,
+            self.metrics,
+            self.performance_monitor,
+            self.operation_name,
+            self.provider,
+            duration,
+            self.operation_id,
+            True,
+            error=error,
         )
 
-        if not success:
-            self.logger.error(f"Operation {self.operation_name} failed: {str(exc_val)}")
+    async def __aenter__(self):
+        """Enter monitoring context from async code."""
+        return self.__enter__()
 
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Exit monitoring context from async code."""
+        self.__exit__(exc_type, exc_val, exc_tb)
 
-def setup_monitoring_integration():
+
+class AsyncMonitoringContext(MonitoringContext):
+    """Async context manager for operation monitoring.
+
+    Recording happens in memory as in MonitoringContext; with flush enabled,
+    exiting also waits for the queued log records to be emitted without
+    blocking the event loop.
+    """
+
+    def __init__(
+        self,
+        operation_name: str,
+        provider: Optional[str] = None,
+        repository: Optional[str] = None,
+        flush: bool = False,
+        **metadata,
+    ):
+        """Initialize async monitoring context.
+
+        Args:
+            operation_name: Name of the operation
+            provider: Provider name
+            repository: Repository name
+            flush: Whether to wait for queued log records on exit
+            **metadata: Additional metadata
+        """
+        super().__init__(operation_name, provider, repository, **metadata)
+        self.flush = flush
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Exit monitoring context, flushing telemetry if requested."""
+        self.__exit__(exc_type, exc_val, exc_tb)
+        if self.flush:
+            await flush_telemetry()
+
+
+async def flush_telemetry(timeout: Optional[float] = None) -> bool:
+    """Wait for queued log records to be emitted.
+
+    The wait runs in a worker thread so the event loop keeps running.
+
+    Args:
+        timeout: Maximum time to wait in seconds, None waits indefinitely
+
+    Returns:
+        True if all queued records were emitted, False on timeout
+    """
+    return await asyncio.to_thread(flush_queue_logging, timeout)
+
+
+def setup_monitoring_integration(enabled: bool = True):
     """Set up monitoring integration for mgit.
 
     This function should be called during application startup to initialize
-    all monitoring components.
+    all monitoring components. Only the first enabled call initializes them;
+    later calls return immediately.
+
+    Args:
+        enabled: Whether monitoring decorators should wrap functions; when
+            False, decorated functions are left untouched and no logging or
+            metrics components are initialized
     """
-    from .logger import setup_structured_logging
-    from .metrics import setup_metrics
+    global _initialized
+    set_monitoring_enabled(enabled)
+    if not enabled or _initialized:
+        return
+    _initialized = True
 
-    # Setup structured logging
+    # Setup structured logging, emitted from a background listener thread
     setup_structured_logging(
         log_level="INFO", include_correlation=True, mask_credentials=True
     )
+    start_queue_logging()
 
     # Setup metrics collection
     setup_metrics()
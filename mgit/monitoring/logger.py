@@ -4,16 +4,75 @@ This module provides JSON-formatted structured logging with automatic
 correlation ID injection and security-aware credential masking.
 """
 
+import atexit
+import collections
+import functools
+import itertools
 import json
 import logging
+import queue
 import sys
+import threading
 import time
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
 
 from ..security.credentials import CredentialMasker
-from .correlation import get_correlation_context, get_correlation_id
+from .correlation import get_correlation_context
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+if ORJSON_AVAILABLE:
+    # Naive UTC timestamps rendered as "...Z", matching the stdlib path
+    _ORJSON_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+
+def _json_default(value: Any) -> Any:
+    """Serialize values the json module does not handle natively.
+
+    Args:
+        value: Value to serialize
+
+    Returns:
+        JSON-compatible representation of the value
+    """
+    if isinstance(value, datetime):
+        return value.isoformat() + "Z"
+    return str(value)
+
+
+def _dumps_log_data(log_data: Dict[str, Any]) -> str:
+    """Serialize a log entry as compact JSON.
+
+    Uses orjson when it is installed and falls back to the json module,
+    also for values orjson rejects such as integers above 64 bits.
+
+    Args:
+        log_data: Log entry to serialize
+
+    Returns:
+        JSON string
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(log_data, default=str, option=_ORJSON_OPTIONS).decode()
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(log_data, default=_json_default, separators=(",", ":"))
+
+
+# LogRecord attributes that are not reported as extra fields. Built from a
+# blank record so attributes added by newer Python versions are covered.
+_RESERVED_RECORD_KEYS = frozenset(
+    logging.LogRecord("", 0, "", 0, "", (), None).__dict__.keys()
+) | frozenset({"message", "asctime", "getMessage", "correlation_context"})
 
 
 class StructuredFormatter(logging.Formatter):
@@ -31,6 +90,29 @@ class StructuredFormatter(logging.Formatter):
         self.mask_credentials = mask_credentials
         if mask_credentials:
             self.masker = CredentialMasker()
+            # Bound once, the search runs on every formatted record
+            self._find_credential = self.masker.ANY_CREDENTIAL_PATTERN.search
+        # Whole second and its formatted prefix from the last timestamp
+        self._last_second: Tuple[int, str] = (-1, "")
+
+    def _format_timestamp(self, created: float) -> str:
+        """Format a record creation time as an ISO 8601 UTC timestamp.
+
+        The date and time up to the second are reused while records keep
+        arriving within the same second.
+
+        Args:
+            created: Record creation time in seconds since the epoch
+
+        Returns:
+            Timestamp with microseconds and a trailing Z
+        """
+        second = int(created)
+        last_second, prefix = self._last_second
+        if second != last_second:
+            prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+            self._last_second = (second, prefix)
+        return f"{prefix}.{int((created - second) * 1_000_000):06d}Z"
 
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as JSON.
@@ -43,7 +125,7 @@ class StructuredFormatter(logging.Formatter):
         """
         # Base log data
         log_data = {
-            "timestamp": datetime.utcfromtimestamp(record.created).isoformat() + "Z",
+            "timestamp": self._format_timestamp(record.created),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -54,78 +136,148 @@ class StructuredFormatter(logging.Formatter):
 
         # Add correlation context if enabled
         if self.include_correlation:
-            correlation_context = get_correlation_context()
+            # Records carry the context captured when they were logged
+            correlation_context = getattr(record, "correlation_context", None)
+            if correlation_context is None:
+                correlation_context = get_correlation_context()
             if correlation_context:
                 log_data["correlation"] = correlation_context
 
         # Add exception info if present
         if record.exc_info:
+            exc_type, exc_value, _ = record.exc_info
+            # Cache the traceback text on the record, as logging.Formatter
+            # does, so each handler formatting the record reuses it
+            if not record.exc_text:
+                record.exc_text = self.formatException(record.exc_info)
             log_data["exception"] = {
-                "type": record.exc_info[0].__name__ if record.exc_info[0] else None,
-                "message": str(record.exc_info[1]) if record.exc_info[1] else None,
-                "traceback": (
-                    self.formatException(record.exc_info) if record.exc_info else None
-                ),
+                "type": exc_type.__name__ if exc_type else None,
+                "message": str(exc_value) if exc_value else None,
+                "traceback": record.exc_text,
             }
 
         # Add extra fields from record
-        extra_fields = {}
-        for key, value in record.__dict__.items():
-            if key not in (
-                "name",
-                "msg",
-                "args",
-                "pathname",
-                "lineno",
-                "funcName",
-                "created",
-                "msecs",
-                "relativeCreated",
-                "thread",
-                "threadName",
-                "processName",
-                "process",
-                "module",
-                "filename",
-                "levelno",
-                "levelname",
-                "exc_info",
-                "exc_text",
-                "stack_info",
-                "getMessage",
-            ):
-                extra_fields[key] = value
+        record_dict = record.__dict__
+        extra_keys = record_dict.keys() - _RESERVED_RECORD_KEYS
+        if extra_keys:
+            log_data["extra"] = {
+                key: value for key, value in record_dict.items() if key in extra_keys
+            }
 
-        if extra_fields:
-            log_data["extra"] = extra_fields
+        output = _dumps_log_data(log_data)
 
         # Mask credentials if enabled
         if self.mask_credentials:
-            log_data = self._mask_sensitive_data(log_data)
+            output = self._mask_output(output, log_data)
+
+        return output
+
+    def _mask_output(self, output: str, log_data: Dict[str, Any]) -> str:
+        """Mask credentials in a serialized log record.
 
-        return json.dumps(log_data, default=str, separators=(",", ":"))
+        Without JSON escapes every string in the record appears verbatim in
+        the output, so the output is searched and masked directly. Records
+        with escapes, or with a match spanning several values, are masked
+        value by value and serialized again.
+
+        Args:
+            output: Serialized log record
+            log_data: Log data the output was serialized from
+
+        Returns:
+            Serialized log record with credentials masked
+        """
+        if "\\" not in output:
+            if not self._find_credential(output):
+                return output
+            masked_output = self.masker.mask_json_text(output)
+            if masked_output is not None:
+                return masked_output
+        return _dumps_log_data(self._mask_sensitive_data(log_data))
 
     def _mask_sensitive_data(self, data: Any) -> Any:
         """Recursively mask sensitive data in log data.
 
+        Containers are copied only when something inside them is masked;
+        unchanged data is returned as is. Credentials in dictionary keys are
+        masked too.
+
         Args:
             data: Data to mask
 
         Returns:
             Data with sensitive information masked
         """
-        if isinstance(data, dict):
-            return {
-                key: self._mask_sensitive_data(value) for key, value in data.items()
-            }
-        elif isinstance(data, list):
-            return [self._mask_sensitive_data(item) for item in data]
-        elif isinstance(data, str):
+        if isinstance(data, str):
             return self.masker.mask_string(data)
+        elif isinstance(data, dict):
+            masked_dict = None
+            for key, value in data.items():
+                masked = self._mask_sensitive_data(value)
+                masked_key = self.masker.mask_string(key)
+                if masked_key is not key:
+                    if masked_dict is None:
+                        masked_dict = dict(data)
+                    del masked_dict[key]
+                    masked_dict[masked_key] = masked
+                elif masked is not value:
+                    if masked_dict is None:
+                        masked_dict = dict(data)
+                    masked_dict[key] = masked
+            return data if masked_dict is None else masked_dict
+        elif isinstance(data, list):
+            masked_list = None
+            for index, item in enumerate(data):
+                masked = self._mask_sensitive_data(item)
+                if masked is not item:
+                    if masked_list is None:
+                        masked_list = list(data)
+                    masked_list[index] = masked
+            return data if masked_list is None else masked_list
         else:
             return data
 
 
+@functools.lru_cache(maxsize=4)
+def _get_formatter(
+    include_correlation: bool, mask_credentials: bool
+) -> StructuredFormatter:
+    """Get the shared structured formatter for a set of options.
+
+    Args:
+        include_correlation: Whether to include correlation ID
+        mask_credentials: Whether to mask credentials
+
+    Returns:
+        StructuredFormatter shared by all default handlers with these options
+    """
+    return StructuredFormatter(
+        include_correlation=include_correlation, mask_credentials=mask_credentials
+    )
+
+
+# Masker for URLs that logging helpers repeat in the message and a field
+_url_masker = CredentialMasker()
+
+# Window in seconds within which identical records are deduplicated, 0 if off
+_dedup_window = 0.0
+
+# Maximum number of distinct records tracked per logger for deduplication
+_MAX_TRACKED_REPEATS = 1024
+
+# Names of loggers already checked for a structured handler
+_structured_logger_names: Set[str] = set()
+
+# Log levels used for security events, keyed by severity name
+_SECURITY_SEVERITY_LEVELS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL,
+}
+
+
 class StructuredLogger:
     """Enhanced logger with structured JSON output and correlation support."""
 
@@ -148,37 +300,76 @@ class StructuredLogger:
         self.logger.setLevel(level)
         self.include_correlation = include_correlation
         self.mask_credentials = mask_credentials
-
-        # Ensure we have structured formatter
-        if not any(
-            isinstance(h.formatter, StructuredFormatter) for h in self.logger.handlers
-        ):
-            self._setup_default_handler()
+        self._default_handler: Optional[logging.Handler] = None
+        # Records logged within the dedup window, oldest first, mapped to
+        # [repeat count, first time, last time]
+        self._repeats: "collections.OrderedDict[Tuple, List[Any]]" = (
+            collections.OrderedDict()
+        )
+        self._repeats_lock = threading.Lock()
+
+        # Ensure we have structured formatter, unless records already reach
+        # the queue-backed root handlers. Handlers are only scanned the first
+        # time a logger name is seen.
+        if _queue_listener is None and name not in _structured_logger_names:
+            if not any(
+                isinstance(h.formatter, StructuredFormatter)
+                for h in self.logger.handlers
+            ):
+                self._setup_default_handler()
+            _structured_logger_names.add(name)
 
     def _setup_default_handler(self) -> None:
         """Set up default structured handler if none exists."""
         handler = logging.StreamHandler(sys.stdout)
-        formatter = StructuredFormatter(
-            include_correlation=self.include_correlation,
-            mask_credentials=self.mask_credentials,
+        handler.setFormatter(
+            _get_formatter(self.include_correlation, self.mask_credentials)
         )
-        handler.setFormatter(formatter)
         self.logger.addHandler(handler)
+        self._default_handler = handler
+
+    def _remove_default_handler(self) -> None:
+        """Remove the default handler installed by this logger, if any."""
+        if self._default_handler is not None:
+            self.logger.removeHandler(self._default_handler)
+            self._default_handler = None
+            _structured_logger_names.discard(self.logger.name)
+
+    def isEnabledFor(self, level: int) -> bool:
+        """Check whether messages at a level would be logged.
+
+        Args:
+            level: Logging level
+
+        Returns:
+            True if the underlying logger handles the level
+        """
+        return self.logger.isEnabledFor(level)
 
-    def _log_with_context(self, level: int, message: str, **kwargs) -> None:
+    def _log_with_context(self, level: int, message: str, *args, **kwargs) -> None:
         """Log message with context data.
 
         Args:
             level: Logging level
-            message: Log message
+            message: Log message, %-formatted with args when emitted
+            *args: Arguments merged into the message
             **kwargs: Additional context data
         """
+        if not self.logger.isEnabledFor(level):
+            return
+
+        if _dedup_window and self._suppress_repeat(level, message, args, kwargs):
+            return
+
         # Create extra dict for structured data
         extra = {}
 
-        # Add correlation ID if available and not disabled
+        # Add correlation ID if available and not disabled. The context is
+        # read once here and carried on the record for the formatter.
         if self.include_correlation:
-            correlation_id = get_correlation_id()
+            correlation_context = get_correlation_context()
+            extra["correlation_context"] = correlation_context
+            correlation_id = correlation_context.get("correlation_id")
             if correlation_id:
                 extra["correlation_id"] = correlation_id
 
@@ -186,52 +377,142 @@ class StructuredLogger:
         if kwargs:
             extra.update(kwargs)
 
-        self.logger.log(level, message, extra=extra)
+        self.logger.log(level, message, *args, extra=extra)
 
-    def debug(self, message: str, **kwargs) -> None:
-        """Log debug message with context.
+    def _suppress_repeat(
+        self, level: int, message: str, args: Tuple, kwargs: Dict[str, Any]
+    ) -> bool:
+        """Count a record that repeats one logged within the dedup window.
+
+        The first occurrence is logged as usual. Identical records that
+        follow within the window are only counted, and a single summary
+        record with the count is logged once the window has passed.
 
         Args:
+            level: Logging level
             message: Log message
+            args: Arguments merged into the message
+            kwargs: Additional context data
+
+        Returns:
+            True if the record was counted instead of logged
+        """
+        now = time.time()
+        summaries = []
+        try:
+            key = (level, message, args, tuple(sorted(kwargs.items())))
+            with self._repeats_lock:
+                self._expire_repeats(now - _dedup_window, summaries)
+                entry = self._repeats.get(key)
+                if entry is not None:
+                    entry[0] += 1
+                    entry[2] = now
+                    return True
+                self._repeats[key] = [0, now, now]
+                if len(self._repeats) > _MAX_TRACKED_REPEATS:
+                    oldest_key, oldest_entry = self._repeats.popitem(last=False)
+                    if oldest_entry[0]:
+                        summaries.append((oldest_key, oldest_entry))
+        except TypeError:
+            # Unhashable context data, such as dict values, is never deduplicated
+            return False
+        finally:
+            for summary_key, summary_entry in summaries:
+                self._log_repeat_summary(summary_key, summary_entry)
+        return False
+
+    def _expire_repeats(self, cutoff: float, summaries: List[Tuple]) -> None:
+        """Stop tracking records first logged before a cutoff time.
+
+        Args:
+            cutoff: Records first logged before this time are expired
+            summaries: Receives the expired records that were repeated
+        """
+        while self._repeats:
+            key, entry = next(iter(self._repeats.items()))
+            if entry[1] >= cutoff:
+                break
+            del self._repeats[key]
+            if entry[0]:
+                summaries.append((key, entry))
+
+    def _log_repeat_summary(self, key: Tuple, entry: List[Any]) -> None:
+        """Log how often a record was repeated after it was first logged.
+
+        Args:
+            key: Level, message, args and context data of the record
+            entry: Repeat count, first time and last time of the record
+        """
+        level, message, args, kwargs = key
+        count, first_time, last_time = entry
+        if not args:
+            # The message was logged without %-formatting, keep it literal
+            message = message.replace("%", "%%")
+        extra = dict(kwargs)
+        extra.update(repeat_count=count, first_ts=first_time, last_ts=last_time)
+        self.logger.log(
+            level, message + " (repeated %d more times)", *args, count, extra=extra
+        )
+
+    def flush_repeats(self) -> None:
+        """Log summaries for all repeated records still being tracked."""
+        with self._repeats_lock:
+            summaries = [
+                (key, entry) for key, entry in self._repeats.items() if entry[0]
+            ]
+            self._repeats.clear()
+        for key, entry in summaries:
+            self._log_repeat_summary(key, entry)
+
+    def debug(self, message: str, *args, **kwargs) -> None:
+        """Log debug message with context.
+
+        Args:
+            message: Log message, %-formatted with args when emitted
+            *args: Arguments merged into the message
             **kwargs: Additional context data
         """
-        self._log_with_context(logging.DEBUG, message, **kwargs)
+        self._log_with_context(logging.DEBUG, message, *args, **kwargs)
 
-    def info(self, message: str, **kwargs) -> None:
+    def info(self, message: str, *args, **kwargs) -> None:
         """Log info message with context.
 
         Args:
-            message: Log message
+            message: Log message, %-formatted with args when emitted
+            *args: Arguments merged into the message
             **kwargs: Additional context data
         """
-        self._log_with_context(logging.INFO, message, **kwargs)
+        self._log_with_context(logging.INFO, message, *args, **kwargs)
 
-    def warning(self, message: str, **kwargs) -> None:
+    def warning(self, message: str, *args, **kwargs) -> None:
         """Log warning message with context.
 
         Args:
-            message: Log message
+            message: Log message, %-formatted with args when emitted
+            *args: Arguments merged into the message
             **kwargs: Additional context data
         """
-        self._log_with_context(logging.WARNING, message, **kwargs)
+        self._log_with_context(logging.WARNING, message, *args, **kwargs)
 
-    def error(self, message: str, **kwargs) -> None:
+    def error(self, message: str, *args, **kwargs) -> None:
         """Log error message with context.
 
         Args:
-            message: Log message
+            message: Log message, %-formatted with args when emitted
+            *args: Arguments merged into the message
             **kwargs: Additional context data
         """
-        self._log_with_context(logging.ERROR, message, **kwargs)
+        self._log_with_context(logging.ERROR, message, *args, **kwargs)
 
-    def critical(self, message: str, **kwargs) -> None:
+    def critical(self, message: str, *args, **kwargs) -> None:
         """Log critical message with context.
 
         Args:
-            message: Log message
+            message: Log message, %-formatted with args when emitted
+            *args: Arguments merged into the message
             **kwargs: Additional context data
         """
-        self._log_with_context(logging.CRITICAL, message, **kwargs)
+        self._log_with_context(logging.CRITICAL, message, *args, **kwargs)
 
     def operation_start(self, operation: str, **kwargs) -> None:
         """Log operation start.
@@ -240,8 +521,12 @@ class StructuredLogger:
             operation: Operation name
             **kwargs: Operation parameters
         """
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+
         self.info(
-            f"Operation started: {operation}",
+            "Operation started: %s",
+            operation,
             operation=operation,
             operation_status="started",
             start_time=time.time(),
@@ -263,6 +548,9 @@ class StructuredLogger:
             duration: Operation duration in seconds
             **kwargs: Additional context
         """
+        if not self.logger.isEnabledFor(logging.INFO if success else logging.ERROR):
+            return
+
         status = "completed" if success else "failed"
         log_data = {
             "operation": operation,
@@ -276,12 +564,14 @@ class StructuredLogger:
 
         log_data.update(kwargs)
 
-        message = f"Operation {status}: {operation}"
+        message = "Operation %s: %s"
+        args: Tuple[Any, ...] = (status, operation)
         if duration is not None:
-            message += f" (took {duration:.2f}s)"
+            message += " (took %.2fs)"
+            args += (duration,)
 
         log_level = self.info if success else self.error
-        log_level(message, **log_data)
+        log_level(message, *args, **log_data)
 
     def api_call(
         self,
@@ -300,6 +590,18 @@ class StructuredLogger:
             response_time: Response time in seconds
             **kwargs: Additional context
         """
+        # Choose log level based on status code
+        if status_code and status_code >= 400:
+            level = logging.WARNING if status_code < 500 else logging.ERROR
+        else:
+            level = logging.INFO
+        if not self.logger.isEnabledFor(level):
+            return
+
+        # Mask the URL once for both the message and the api_url field
+        if self.mask_credentials:
+            url = _url_masker.mask_string(url)
+
         log_data = {"api_method": method, "api_url": url, "api_call": True}
 
         if status_code is not None:
@@ -310,19 +612,16 @@ class StructuredLogger:
 
         log_data.update(kwargs)
 
-        message = f"API {method} {url}"
+        message = "API %s %s"
+        args: Tuple[Any, ...] = (method, url)
         if status_code is not None:
-            message += f" -> {status_code}"
+            message += " -> %s"
+            args += (status_code,)
         if response_time is not None:
-            message += f" ({response_time:.2f}s)"
-
-        # Choose log level based on status code
-        if status_code and status_code >= 400:
-            log_level = self.warning if status_code < 500 else self.error
-        else:
-            log_level = self.info
+            message += " (%.2fs)"
+            args += (response_time,)
 
-        log_level(message, **log_data)
+        self._log_with_context(level, message, *args, **log_data)
 
     def git_operation(
         self, operation: str, repository: str, success: bool = True, **kwargs
@@ -335,6 +634,13 @@ class StructuredLogger:
             success: Whether operation succeeded
             **kwargs: Additional context
         """
+        if not self.logger.isEnabledFor(logging.INFO if success else logging.ERROR):
+            return
+
+        # Mask the repository once for both the message and its field
+        if self.mask_credentials:
+            repository = _url_masker.mask_string(repository)
+
         log_data = {
             "git_operation": operation,
             "repository": repository,
@@ -343,10 +649,9 @@ class StructuredLogger:
         log_data.update(kwargs)
 
         status = "completed" if success else "failed"
-        message = f"Git {operation} {status}: {repository}"
 
         log_level = self.info if success else self.error
-        log_level(message, **log_data)
+        log_level("Git %s %s: %s", operation, status, repository, **log_data)
 
     def authentication(
         self, provider: str, organization: str, success: bool, **kwargs
@@ -359,6 +664,9 @@ class StructuredLogger:
             success: Whether authentication succeeded
             **kwargs: Additional context
         """
+        if not self.logger.isEnabledFor(logging.INFO if success else logging.WARNING):
+            return
+
         log_data = {
             "auth_provider": provider,
             "auth_organization": organization,
@@ -367,10 +675,11 @@ class StructuredLogger:
         log_data.update(kwargs)
 
         status = "successful" if success else "failed"
-        message = f"Authentication {status}: {provider}:{organization}"
 
         log_level = self.info if success else self.warning
-        log_level(message, **log_data)
+        log_level(
+            "Authentication %s: %s:%s", status, provider, organization, **log_data
+        )
 
     def performance_metric(
         self, metric_name: str, value: float, unit: str = "seconds", **kwargs
@@ -383,8 +692,14 @@ class StructuredLogger:
             unit: Metric unit
             **kwargs: Additional context
         """
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+
         self.info(
-            f"Performance metric: {metric_name} = {value} {unit}",
+            "Performance metric: %s = %s %s",
+            metric_name,
+            value,
+            unit,
             metric_name=metric_name,
             metric_value=value,
             metric_unit=unit,
@@ -403,6 +718,11 @@ class StructuredLogger:
             details: Event details
             **kwargs: Additional context
         """
+        # Choose log level based on severity
+        level = _SECURITY_SEVERITY_LEVELS.get(severity.upper(), logging.INFO)
+        if not self.logger.isEnabledFor(level):
+            return
+
         log_data = {
             "security_event_type": event_type,
             "security_severity": severity,
@@ -410,23 +730,322 @@ class StructuredLogger:
         }
         log_data.update(kwargs)
 
-        message = f"SECURITY[{event_type}]: {details}"
+        self._log_with_context(
+            level, "SECURITY[%s]: %s", event_type, details, **log_data
+        )
+
+
+# Renders tracebacks of queued records on the producer thread
+_TRACEBACK_FORMATTER = logging.Formatter()
 
-        # Choose log level based on severity
-        severity_levels = {
-            "DEBUG": self.debug,
-            "INFO": self.info,
-            "WARNING": self.warning,
-            "ERROR": self.error,
-            "CRITICAL": self.critical,
-        }
 
-        log_level = severity_levels.get(severity.upper(), self.info)
-        log_level(message, **log_data)
+class _CorrelationQueueHandler(QueueHandler):
+    """Queue handler that snapshots the correlation context of each record.
+
+    Queued records are formatted on the listener thread, where the producer's
+    correlation context is no longer visible. Records logged through a
+    StructuredLogger already carry it.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Merge the message with its arguments for the queued copy.
+
+        The structured formatting itself happens on the listener thread.
+
+        Args:
+            record: Log record to enqueue
+
+        Returns:
+            The merged message
+        """
+        return record.getMessage()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Snapshot a record before it is handed to the listener thread.
+
+        The current correlation context is attached unless the record has
+        one, then QueueHandler.prepare merges msg and args into a copy of the
+        record so the caller's arguments are not read after they may have
+        changed. The exception type and value are kept with the traceback
+        rendered as text, for the structured exception field.
+
+        Args:
+            record: Log record to enqueue
+
+        Returns:
+            Copy of the record, formatted later by the listener's handlers
+        """
+        if getattr(record, "correlation_context", None) is None:
+            record.correlation_context = get_correlation_context()
+        exc_info = record.exc_info
+        if exc_info and not record.exc_text:
+            record.exc_text = _TRACEBACK_FORMATTER.formatException(exc_info)
+        exc_text = record.exc_text
+
+        record = super().prepare(record)
+        if exc_info:
+            record.exc_info = (exc_info[0], exc_info[1], None)
+            record.exc_text = exc_text
+        return record
+
+    def handle(self, record: logging.LogRecord) -> Any:
+        """Filter and enqueue a record without taking the handler lock.
+
+        The ring buffer queue is safe to use from any thread, so producers
+        do not need to serialize on the handler.
+
+        Args:
+            record: Log record to enqueue
+
+        Returns:
+            The filter result, as for logging.Handler.handle
+        """
+        rv = self.filter(record)
+        if isinstance(rv, logging.LogRecord):
+            record = rv
+        if rv:
+            self.emit(record)
+        return rv
+
+
+class _RingBufferQueue:
+    """Bounded log record queue that drops the oldest records when full.
+
+    Producers never block: once ``maxsize`` records are waiting, each new
+    record evicts the oldest one. Control items (flush markers and the
+    listener's stop sentinel) travel on a separate unbounded channel so
+    they are never evicted. Records and control items share one sequence
+    counter, and a control item is handed out as soon as the records queued
+    before it have been consumed or evicted, even while newer records keep
+    arriving.
+    """
+
+    def __init__(self, maxsize: int):
+        """Initialize ring buffer queue.
+
+        Args:
+            maxsize: Maximum number of records held before dropping
+        """
+        self.maxsize = maxsize
+        self.dropped = 0
+        self._sequence = itertools.count()
+        self._records: "collections.deque[Tuple[int, Any]]" = collections.deque(
+            maxlen=maxsize
+        )
+        self._control: "collections.deque[Tuple[int, Any]]" = collections.deque()
+        self._ready = threading.Event()
+
+    def put_nowait(self, record: Any) -> None:
+        """Queue a log record, evicting the oldest one if full.
+
+        Args:
+            record: Log record to queue
+        """
+        records = self._records
+        if len(records) == self.maxsize:
+            self.dropped += 1
+        records.append((next(self._sequence), record))
+        if not self._ready.is_set():
+            self._ready.set()
+
+    def put_control(self, item: Any) -> None:
+        """Queue a control item that must not be dropped.
+
+        Args:
+            item: Flush marker or stop sentinel
+        """
+        self._control.append((next(self._sequence), item))
+        self._ready.set()
+
+    def empty(self) -> bool:
+        """Check whether no records or control items are waiting.
+
+        Returns:
+            True if the queue is empty
+        """
+        return not self._records and not self._control
+
+    def get(self, block: bool = True) -> Any:
+        """Remove and return the next record or control item.
+
+        Only the listener thread consumes, so a non-empty deque stays
+        non-empty until this method pops from it.
+
+        Args:
+            block: Whether to wait for an item to arrive
+
+        Returns:
+            The next queued item
+
+        Raises:
+            queue.Empty: If block is False and nothing is queued
+        """
+        records = self._records
+        control = self._control
+        while True:
+            if control and (not records or control[0][0] < records[0][0]):
+                return control.popleft()[1]
+            if records:
+                return records.popleft()[1]
+            if not block:
+                raise queue.Empty
+            self._ready.clear()
+            # Re-check after clearing so an item queued meanwhile is not missed
+            if records or control:
+                continue
+            self._ready.wait()
+
+
+class _BatchedWrites:
+    """Mixin for stream handlers that can defer flushing to batch writes.
+
+    While ``batching`` is on, which the queue listener enables for the
+    handlers it drives, formatted records are written to the stream without
+    a flush. The stream is flushed once ``flush_size_bytes`` characters have
+    accumulated, ``flush_timeout`` seconds have passed since the last flush,
+    or the listener has drained the queue. With batching off the handler
+    behaves like a plain stream handler.
+    """
+
+    batching = False
+    flush_size_bytes = 65536
+    flush_timeout = 0.1
+    _pending_size = 0
+    _last_flush = 0.0
+
+    def handle(self, record: logging.LogRecord) -> Any:
+        """Filter and emit a record, without the handler lock when batching.
+
+        Batching is only enabled while the queue listener thread is the sole
+        caller, so records cannot interleave and the lock is skipped.
+
+        Args:
+            record: Log record to handle
+
+        Returns:
+            The filter result, as for logging.Handler.handle
+        """
+        if not self.batching:
+            return super().handle(record)
+
+        rv = self.filter(record)
+        if isinstance(rv, logging.LogRecord):
+            record = rv
+        if rv:
+            self.emit(record)
+        return rv
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Write a record, flushing only when a batch is complete.
+
+        Args:
+            record: Log record to write
+        """
+        if not self.batching or self.stream is None:
+            super().emit(record)
+            return
+
+        try:
+            message = self.format(record) + self.terminator
+            self.stream.write(message)
+            self._pending_size += len(message)
+            if (
+                self._pending_size >= self.flush_size_bytes
+                or time.monotonic() - self._last_flush >= self.flush_timeout
+            ):
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def flush(self) -> None:
+        """Flush the stream and start a new batch."""
+        super().flush()
+        self._pending_size = 0
+        self._last_flush = time.monotonic()
+
+    def configure_batching(
+        self, flush_size_bytes: int = 65536, flush_timeout_ms: int = 100
+    ) -> None:
+        """Set the batch limits used while batching is enabled.
+
+        Args:
+            flush_size_bytes: Buffered output size that triggers a flush
+            flush_timeout_ms: Maximum time between flushes in milliseconds
+        """
+        self.flush_size_bytes = flush_size_bytes
+        self.flush_timeout = flush_timeout_ms / 1000
+
+
+class _BatchingStreamHandler(_BatchedWrites, logging.StreamHandler):
+    """Stream handler with batched writes under the queue listener."""
+
+
+class _BatchingFileHandler(_BatchedWrites, logging.FileHandler):
+    """File handler with batched writes under the queue listener.
+
+    The file is opened with a larger write buffer than the io default, so
+    a batch reaches the kernel in a few large writes instead of one write
+    per record.
+    """
+
+    buffer_size = 1 << 16
+
+    def _open(self) -> Any:
+        """Open the log file with an enlarged write buffer.
+
+        Returns:
+            The opened text stream
+        """
+        return open(
+            self.baseFilename,
+            self.mode,
+            buffering=self.buffer_size,
+            encoding=self.encoding,
+            errors=self.errors,
+        )
+
+
+class _StructuredQueueListener(QueueListener):
+    """Queue listener that also acknowledges flush requests.
+
+    A threading.Event placed on the queue is set once every record queued
+    before it has been handled. Batching handlers are flushed whenever the
+    queue runs empty, so output is only held back while more records wait.
+    """
+
+    def _flush_handlers(self) -> None:
+        """Flush handlers that defer flushing to the listener."""
+        for handler in self.handlers:
+            if isinstance(handler, _BatchedWrites):
+                handler.flush()
+
+    def enqueue_sentinel(self) -> None:
+        """Queue the stop sentinel on the queue's control channel."""
+        self.queue.put_control(self._sentinel)
+
+    def handle(self, record: Any) -> None:
+        """Handle a queued record or flush marker.
+
+        Args:
+            record: Log record, or an Event marking a flush request
+        """
+        if isinstance(record, threading.Event):
+            self._flush_handlers()
+            record.set()
+            return
+        super().handle(record)
+        if self.queue.empty():
+            self._flush_handlers()
 
 
 # Global structured loggers
-_structured_loggers: Dict[str, StructuredLogger] = {}
+_structured_loggers: Dict[Tuple[str, int, bool, bool], StructuredLogger] = {}
+_structured_loggers_lock = threading.Lock()
+
+# Background listener draining the root logger queue, if enabled
+_queue_listener: Optional[_StructuredQueueListener] = None
 
 
 def get_structured_logger(
@@ -446,15 +1065,24 @@ def get_structured_logger(
     Returns:
         StructuredLogger instance
     """
-    key = f"{name}:{level}:{include_correlation}:{mask_credentials}"
-    if key not in _structured_loggers:
-        _structured_loggers[key] = StructuredLogger(
-            name=name,
-            level=level,
-            include_correlation=include_correlation,
-            mask_credentials=mask_credentials,
-        )
-    return _structured_loggers[key]
+    key = (name, level, include_correlation, mask_credentials)
+    structured_logger = _structured_loggers.get(key)
+    if structured_logger is not None:
+        return structured_logger
+
+    # Create under the lock so concurrent first calls share one instance
+    # and attach at most one default handler
+    with _structured_loggers_lock:
+        structured_logger = _structured_loggers.get(key)
+        if structured_logger is None:
+            structured_logger = StructuredLogger(
+                name=name,
+                level=level,
+                include_correlation=include_correlation,
+                mask_credentials=mask_credentials,
+            )
+            _structured_loggers[key] = structured_logger
+    return structured_logger
 
 
 def setup_structured_logging(
@@ -463,6 +1091,9 @@ def setup_structured_logging(
     console_level: str = "INFO",
     include_correlation: bool = True,
     mask_credentials: bool = True,
+    flush_size_bytes: int = 65536,
+    flush_timeout_ms: int = 100,
+    dedup_window_ms: int = 0,
 ) -> None:
     """Set up structured logging configuration.
 
@@ -472,21 +1103,39 @@ def setup_structured_logging(
         console_level: Console logging level
         include_correlation: Whether to include correlation ID
         mask_credentials: Whether to mask credentials
+        flush_size_bytes: With queue logging, buffered output size that
+            triggers a flush of the console and file streams
+        flush_timeout_ms: With queue logging, maximum time between flushes
+            in milliseconds
+        dedup_window_ms: Window in milliseconds within which identical
+            structured log records are logged once and then summarized
+            with a repeat count, 0 to disable deduplication
     """
+    global _dedup_window
+
+    # Restore synchronous handlers before replacing them
+    stop_queue_logging()
+    flush_repeated_records()
+    _dedup_window = dedup_window_ms / 1000
+
+    file_level = getattr(logging, log_level.upper())
+    console_level_no = getattr(logging, console_level.upper())
+    formatter = StructuredFormatter(
+        include_correlation=include_correlation, mask_credentials=mask_credentials
+    )
+
     # Create root logger
     root_logger = logging.getLogger()
-    root_logger.setLevel(getattr(logging, log_level.upper()))
+    root_logger.setLevel(file_level)
 
     # Clear existing handlers
     root_logger.handlers.clear()
 
     # Console handler with structured formatting
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(getattr(logging, console_level.upper()))
-    console_formatter = StructuredFormatter(
-        include_correlation=include_correlation, mask_credentials=mask_credentials
-    )
-    console_handler.setFormatter(console_formatter)
+    console_handler = _BatchingStreamHandler(sys.stdout)
+    console_handler.configure_batching(flush_size_bytes, flush_timeout_ms)
+    console_handler.setLevel(console_level_no)
+    console_handler.setFormatter(formatter)
     root_logger.addHandler(console_handler)
 
     # File handler if specified
@@ -494,10 +1143,100 @@ def setup_structured_logging(
         log_path = Path(log_file)
         log_path.parent.mkdir(parents=True, exist_ok=True)
 
-        file_handler = logging.FileHandler(log_path)
-        file_handler.setLevel(getattr(logging, log_level.upper()))
-        file_formatter = StructuredFormatter(
-            include_correlation=include_correlation, mask_credentials=mask_credentials
-        )
-        file_handler.setFormatter(file_formatter)
+        file_handler = _BatchingFileHandler(log_path)
+        file_handler.configure_batching(flush_size_bytes, flush_timeout_ms)
+        file_handler.setLevel(file_level)
+        file_handler.setFormatter(formatter)
         root_logger.addHandler(file_handler)
+
+
+def start_queue_logging(max_queue_size: int = 65536) -> None:
+    """Move root logger handlers onto a background listener thread.
+
+    The root logger's handlers are replaced by a queue handler, so callers
+    only pay for an enqueue while formatting and I/O happen on the listener
+    thread. The queue is bounded and drops its oldest records when a stalled
+    sink lets it fill up, so logging never blocks the caller. Structured
+    loggers drop their default stdout handlers, since their records reach
+    the root handlers by propagation.
+
+    Args:
+        max_queue_size: Maximum number of records waiting to be emitted
+    """
+    global _queue_listener
+    if _queue_listener is not None:
+        return
+
+    root_logger = logging.getLogger()
+    handlers = list(root_logger.handlers)
+    if not handlers:
+        return
+
+    log_queue = _RingBufferQueue(max_queue_size)
+    _queue_listener = _StructuredQueueListener(
+        log_queue, *handlers, respect_handler_level=True
+    )
+    root_logger.handlers = [_CorrelationQueueHandler(log_queue)]
+
+    # Only the listener thread writes now, so its handlers may batch
+    for handler in handlers:
+        if isinstance(handler, _BatchedWrites):
+            handler.batching = True
+
+    for structured_logger in list(_structured_loggers.values()):
+        structured_logger._remove_default_handler()
+
+    _queue_listener.start()
+
+
+def flush_repeated_records() -> None:
+    """Log repeat summaries held back by every structured logger."""
+    for structured_logger in list(_structured_loggers.values()):
+        structured_logger.flush_repeats()
+
+
+def flush_queue_logging(timeout: Optional[float] = None) -> bool:
+    """Block until every record queued so far has been emitted or dropped.
+
+    Pending repeat summaries are logged first, so they are flushed too.
+
+    Args:
+        timeout: Maximum time to wait in seconds, None waits indefinitely
+
+    Returns:
+        True if the queue was flushed, False if the timeout expired
+    """
+    flush_repeated_records()
+
+    listener = _queue_listener
+    if listener is None:
+        return True
+
+    flushed = threading.Event()
+    listener.queue.put_control(flushed)
+    return flushed.wait(timeout)
+
+
+def stop_queue_logging() -> None:
+    """Stop the background listener and restore synchronous root handlers.
+
+    Records still queued are flushed before the handlers are restored.
+    """
+    global _queue_listener
+    if _queue_listener is None:
+        return
+
+    listener = _queue_listener
+    _queue_listener = None
+    listener.stop()
+
+    for handler in listener.handlers:
+        if isinstance(handler, _BatchedWrites):
+            handler.batching = False
+            handler.flush()
+    logging.getLogger().handlers = list(listener.handlers)
+
+
+atexit.register(stop_queue_logging)
+# Registered last so it runs first at exit, while the listener still runs
+atexit.register(flush_repeated_records)
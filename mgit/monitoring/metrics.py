@@ -4,15 +4,95 @@ This module provides metrics collection and exposition in Prometheus format
 for monitoring operation performance, success rates, and system health.
 """
 
+import bisect
+import functools
+import io
 import json
+import operator
+import sys
 import threading
 import time
-from collections import defaultdict
+from collections import defaultdict, deque
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Deque, Dict, Iterable, List, Optional, Tuple
 
+try:
+    import orjson
 
-@dataclass
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# (kind, name, value, labels) tuple accepted by MetricsCollector.update_batch
+MetricUpdate = Tuple[str, str, float, Optional[Dict[str, str]]]
+
+# Number of counter/histogram stripes; must be a power of two
+_NUM_STRIPES = 8
+_STRIPE_MASK = _NUM_STRIPES - 1
+
+# (operation, success, duration, provider, error_type) buffered by
+# MetricsCollector.record_operation_result
+_OperationResult = Tuple[str, bool, Optional[float], Optional[str], Optional[str]]
+
+# Buffered operation results are applied once a thread has this many
+_RESULT_BATCH_SIZE = 128
+
+# When False, recording methods return before building keys or taking locks
+_ENABLED = True
+
+# Histogram bucket upper bounds in seconds: the Prometheus defaults, extended
+# to cover long-running Git operations
+_HISTOGRAM_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+    120.0,
+    300.0,
+    600.0,
+)
+
+# Metric name and its (label, value) pairs sorted by label name
+_MetricKey = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+# "le" label values of the histogram buckets, including the overflow bucket
+_HISTOGRAM_BUCKET_LABELS = tuple(str(bound) for bound in _HISTOGRAM_BUCKETS) + ("+Inf",)
+
+
+def _dumps_json(data: Any, pretty: bool = False) -> str:
+    """Serialize exported metrics as JSON.
+
+    Uses orjson when it is installed and falls back to the json module.
+
+    Args:
+        data: Data to serialize
+        pretty: Indent the output for human readers
+
+    Returns:
+        JSON string
+    """
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_INDENT_2 if pretty else 0
+        return orjson.dumps(data, option=option).decode()
+    if pretty:
+        return json.dumps(data, indent=2)
+    return json.dumps(data, separators=(",", ":"))
+
+
+# dataclass(slots=True) needs Python 3.10; older versions keep a __dict__
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
 class MetricSample:
     """Represents a single metric sample."""
 
@@ -24,112 +104,288 @@ class MetricSample:
     metric_type: str = "gauge"  # gauge, counter, histogram, summary
 
 
+# (name, type, help text) of the metrics every collector starts with
+_DEFAULT_METRICS: Tuple[Tuple[str, str, str], ...] = (
+    # Operation counters
+    ("mgit_operations_total", "counter", "Total number of mgit operations"),
+    (
+        "mgit_operations_success_total",
+        "counter",
+        "Total number of successful mgit operations",
+    ),
+    (
+        "mgit_operations_failure_total",
+        "counter",
+        "Total number of failed mgit operations",
+    ),
+    # Git operations
+    ("mgit_git_operations_total", "counter", "Total number of Git operations"),
+    (
+        "mgit_git_clone_duration_seconds",
+        "histogram",
+        "Duration of Git clone operations",
+    ),
+    ("mgit_git_pull_duration_seconds", "histogram", "Duration of Git pull operations"),
+    # API metrics
+    ("mgit_api_requests_total", "counter", "Total number of API requests"),
+    ("mgit_api_request_duration_seconds", "histogram", "Duration of API requests"),
+    ("mgit_api_errors_total", "counter", "Total number of API errors"),
+    # Authentication metrics
+    ("mgit_auth_attempts_total", "counter", "Total number of authentication attempts"),
+    (
+        "mgit_auth_success_total",
+        "counter",
+        "Total number of successful authentications",
+    ),
+    ("mgit_auth_failures_total", "counter", "Total number of failed authentications"),
+    # Provider metrics
+    ("mgit_provider_operations_total", "counter", "Total operations by provider"),
+    (
+        "mgit_provider_rate_limit_hits_total",
+        "counter",
+        "Total rate limit hits by provider",
+    ),
+    # System metrics
+    ("mgit_concurrent_operations", "gauge", "Number of concurrent operations"),
+    ("mgit_repositories_processed", "gauge", "Total repositories processed"),
+    # Error metrics
+    ("mgit_errors_total", "counter", "Total number of errors"),
+    ("mgit_validation_errors_total", "counter", "Total number of validation errors"),
+)
+
+
+def _label_items(labels: Optional[Dict[str, str]]) -> Tuple[Tuple[str, str], ...]:
+    """Normalize labels into the (label, value) pairs used in metric keys.
+
+    Args:
+        labels: Optional labels dictionary
+
+    Returns:
+        Pairs sorted by label, with values converted to strings
+    """
+    if not labels:
+        return ()
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+@functools.lru_cache(maxsize=4096)
+def _render_labels(label_items: Tuple[Tuple[str, str], ...]) -> str:
+    """Render (label, value) pairs as a Prometheus label set.
+
+    Label sets repeat on every scrape, so the rendered text is cached.
+
+    Args:
+        label_items: Pairs in the order they are rendered
+
+    Returns:
+        Label set in braces, or an empty string when there are no labels
+    """
+    if not label_items:
+        return ""
+    return "{" + ",".join(f'{k}="{v}"' for k, v in label_items) + "}"
+
+
+@functools.lru_cache(maxsize=1024)
+def _bucket_label_items(
+    label_items: Tuple[Tuple[str, str], ...],
+) -> Tuple[Tuple[Tuple[str, str], ...], ...]:
+    """Build the sorted label pairs of each bucket of a histogram.
+
+    Args:
+        label_items: Sorted label pairs of the histogram
+
+    Returns:
+        Label pairs including "le", one tuple per bucket
+    """
+    return tuple(
+        tuple(sorted(label_items + (("le", le),))) for le in _HISTOGRAM_BUCKET_LABELS
+    )
+
+
+@functools.lru_cache(maxsize=1024)
+def _operation_keys(
+    operation: str,
+    provider: Optional[str],
+    extra_items: Tuple[Tuple[str, str], ...] = (),
+) -> Tuple[_MetricKey, _MetricKey, _MetricKey, _MetricKey]:
+    """Build the metric keys recorded for an operation.
+
+    Operations repeat with the same labels, so the keys are cached.
+
+    Args:
+        operation: Operation name
+        provider: Provider name if applicable
+        extra_items: Additional (label, value) pairs
+
+    Returns:
+        Keys of the total, success and failure counters and of the duration
+        histogram
+    """
+    labels = {"operation": operation}
+    if provider:
+        labels["provider"] = provider
+    labels.update(extra_items)
+    label_items = _label_items(labels)
+    return (
+        ("mgit_operations_total", label_items),
+        ("mgit_operations_success_total", label_items),
+        ("mgit_operations_failure_total", label_items),
+        (f"mgit_{operation}_duration_seconds", label_items),
+    )
+
+
+@functools.lru_cache(maxsize=1024)
+def _operation_error_key(
+    error_type: str, operation: str, provider: Optional[str]
+) -> _MetricKey:
+    """Build the error counter key recorded for a failed operation.
+
+    Args:
+        error_type: Type of error
+        operation: Operation name
+        provider: Provider name if applicable
+
+    Returns:
+        Key of the error counter
+    """
+    labels = {"error_type": error_type, "operation": operation}
+    if provider:
+        labels["provider"] = provider
+    return "mgit_errors_total", _label_items(labels)
+
+
+@functools.lru_cache(maxsize=1024)
+def _trace_keys(
+    operation: str, success: bool
+) -> Tuple[_MetricKey, _MetricKey, _MetricKey]:
+    """Build the metric keys recorded when a performance trace ends.
+
+    Args:
+        operation: Operation name
+        success: Whether the operation succeeded
+
+    Returns:
+        Keys of the duration histogram, the completed counter and the error
+        counter
+    """
+    outcome_items = _label_items({"operation": operation, "success": str(success)})
+    return (
+        ("mgit_performance_operation_duration_seconds", outcome_items),
+        ("mgit_performance_operations_completed_total", outcome_items),
+        ("mgit_performance_operations_errors_total", (("operation", operation),)),
+    )
+
+
+class _Histogram:
+    """Fixed-bucket histogram holding per-bucket counts, a sum and a count.
+
+    Memory stays constant no matter how many values are observed. The last
+    bucket counts values above the largest bound.
+    """
+
+    __slots__ = ("buckets", "sum", "count")
+
+    def __init__(self):
+        self.buckets = [0] * (len(_HISTOGRAM_BUCKETS) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        """Count a value in the first bucket whose bound is not below it.
+
+        Args:
+            value: Observed value
+        """
+        self.buckets[bisect.bisect_left(_HISTOGRAM_BUCKETS, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def merge(self, other: "_Histogram") -> None:
+        """Add another histogram's counts to this one.
+
+        Args:
+            other: Histogram to add
+        """
+        self.buckets = list(map(operator.add, self.buckets, other.buckets))
+        self.sum += other.sum
+        self.count += other.count
+
+
+class _MetricStripe:
+    """Counter and histogram cells updated by a subset of threads.
+
+    Each thread writes to the stripe selected by its native thread ID, so
+    concurrent workers rarely contend on the same lock. Readers sum the
+    stripes.
+    """
+
+    __slots__ = ("lock", "counters", "histograms")
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.counters: Dict[_MetricKey, float] = defaultdict(float)
+        self.histograms: Dict[_MetricKey, _Histogram] = {}
+
+    def clear(self) -> None:
+        """Drop all values held by the stripe."""
+        with self.lock:
+            self.counters.clear()
+            self.histograms.clear()
+
+
+class _GaugeShard:
+    """Gauge values for the subset of keys that hash to this shard.
+
+    A gauge keeps its last value, so each key lives in exactly one shard,
+    selected by the hash of the key.
+    """
+
+    __slots__ = ("lock", "values")
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.values: Dict[_MetricKey, float] = {}
+
+    def clear(self) -> None:
+        """Drop all values held by the shard."""
+        with self.lock:
+            self.values.clear()
+
+
 class MetricsCollector:
     """Prometheus-compatible metrics collector."""
 
     def __init__(self):
         """Initialize metrics collector."""
+        # Guards metric metadata and the per-thread registries; counters and
+        # histograms live in per-thread stripes and gauges in per-key shards,
+        # each with their own lock
         self.lock = threading.Lock()
-        self._counters: Dict[str, float] = defaultdict(float)
-        self._gauges: Dict[str, float] = defaultdict(float)
-        self._histograms: Dict[str, List[float]] = defaultdict(list)
-        self._counter_labels: Dict[str, Dict[str, str]] = {}
-        self._gauge_labels: Dict[str, Dict[str, str]] = {}
-        self._histogram_labels: Dict[str, Dict[str, str]] = {}
+        self._stripes = [_MetricStripe() for _ in range(_NUM_STRIPES)]
+        self._gauge_shards = [_GaugeShard() for _ in range(_NUM_STRIPES)]
         self._metric_help: Dict[str, str] = {}
         self._metric_types: Dict[str, str] = {}
 
-        # Operation tracking
-        self._operation_start_times: Dict[str, float] = {}
+        # Operation tracking: monotonic start times in nanoseconds, one dict
+        # per thread so timers started and ended on one thread take no lock
+        self._timers = threading.local()
+        self._timer_dicts: List[Tuple[threading.Thread, Dict[str, int]]] = []
+
+        # Operation results waiting to be applied, one buffer per thread
+        self._pending = threading.local()
+        self._pending_buffers: List[
+            Tuple[threading.Thread, Deque[_OperationResult]]
+        ] = []
 
         # Register default metrics
         self._register_default_metrics()
 
     def _register_default_metrics(self) -> None:
-        """Register default mgit metrics."""
-        # Operation counters
-        self.register_metric(
-            "mgit_operations_total", "counter", "Total number of mgit operations"
-        )
-        self.register_metric(
-            "mgit_operations_success_total",
-            "counter",
-            "Total number of successful mgit operations",
-        )
-        self.register_metric(
-            "mgit_operations_failure_total",
-            "counter",
-            "Total number of failed mgit operations",
-        )
-
-        # Git operations
-        self.register_metric(
-            "mgit_git_operations_total", "counter", "Total number of Git operations"
-        )
-        self.register_metric(
-            "mgit_git_clone_duration_seconds",
-            "histogram",
-            "Duration of Git clone operations",
-        )
-        self.register_metric(
-            "mgit_git_pull_duration_seconds",
-            "histogram",
-            "Duration of Git pull operations",
-        )
-
-        # API metrics
-        self.register_metric(
-            "mgit_api_requests_total", "counter", "Total number of API requests"
-        )
-        self.register_metric(
-            "mgit_api_request_duration_seconds", "histogram", "Duration of API requests"
-        )
-        self.register_metric(
-            "mgit_api_errors_total", "counter", "Total number of API errors"
-        )
-
-        # Authentication metrics
-        self.register_metric(
-            "mgit_auth_attempts_total",
-            "counter",
-            "Total number of authentication attempts",
-        )
-        self.register_metric(
-            "mgit_auth_success_total",
-            "counter",
-            "Total number of successful authentications",
-        )
-        self.register_metric(
-            "mgit_auth_failures_total",
-            "counter",
-            "Total number of failed authentications",
-        )
-
-        # Provider metrics
-        self.register_metric(
-            "mgit_provider_operations_total", "counter", "Total operations by provider"
-        )
-        self.register_metric(
-            "mgit_provider_rate_limit_hits_total",
-            "counter",
-            "Total rate limit hits by provider",
-        )
-
-        # System metrics
-        self.register_metric(
-            "mgit_concurrent_operations", "gauge", "Number of concurrent operations"
-        )
-        self.register_metric(
-            "mgit_repositories_processed", "gauge", "Total repositories processed"
-        )
-
-        # Error metrics
-        self.register_metric("mgit_errors_total", "counter", "Total number of errors")
-        self.register_metric(
-            "mgit_validation_errors_total",
-            "counter",
-            "Total number of validation errors",
-        )
+        """Register default mgit metrics under a single lock acquisition."""
+        with self.lock:
+            for name, metric_type, help_text in _DEFAULT_METRICS:
+                self._metric_types[name] = metric_type
+                self._metric_help[name] = help_text
 
     def register_metric(self, name: str, metric_type: str, help_text: str) -> None:
         """Register a metric with its type and help text.
@@ -153,11 +409,12 @@ class MetricsCollector:
             value: Increment value
             labels: Optional labels dictionary
         """
-        with self.lock:
-            key = self._make_key(name, labels)
-            self._counters[key] += value
-            if labels:
-                self._counter_labels[key] = labels.copy()
+        if not _ENABLED:
+            return
+        key = self._make_key(name, labels)
+        stripe = self._stripe()
+        with stripe.lock:
+            self._inc_counter(stripe, key, value)
 
     def set_gauge(
         self, name: str, value: float, labels: Optional[Dict[str, str]] = None
@@ -169,11 +426,9 @@ class MetricsCollector:
             value: Gauge value
             labels: Optional labels dictionary
         """
-        with self.lock:
-            key = self._make_key(name, labels)
-            self._gauges[key] = value
-            if labels:
-                self._gauge_labels[key] = labels.copy()
+        if not _ENABLED:
+            return
+        self._set_gauge(self._make_key(name, labels), value)
 
     def observe_histogram(
         self, name: str, value: float, labels: Optional[Dict[str, str]] = None
@@ -185,28 +440,80 @@ class MetricsCollector:
             value: Observed value
             labels: Optional labels dictionary
         """
-        with self.lock:
-            key = self._make_key(name, labels)
-            self._histograms[key].append(value)
-            if labels:
-                self._histogram_labels[key] = labels.copy()
+        if not _ENABLED:
+            return
+        key = self._make_key(name, labels)
+        stripe = self._stripe()
+        with stripe.lock:
+            self._observe_histogram(stripe, key, value)
+
+    def update_batch(self, updates: Iterable[MetricUpdate]) -> None:
+        """Apply several metric updates under a single stripe lock.
+
+        Args:
+            updates: Iterable of (kind, name, value, labels) tuples where kind
+                is one of "counter", "gauge" or "histogram"
+        """
+        if not _ENABLED:
+            return
+        stripe = self._stripe()
+        with stripe.lock:
+            for kind, name, value, labels in updates:
+                key = self._make_key(name, labels)
+                if kind == "counter":
+                    self._inc_counter(stripe, key, value)
+                elif kind == "gauge":
+                    self._set_gauge(key, value)
+                elif kind == "histogram":
+                    self._observe_histogram(stripe, key, value)
+                else:
+                    raise ValueError(f"Unknown metric kind: {kind}")
+
+    def _stripe(self) -> _MetricStripe:
+        """Get the counter/histogram stripe for the calling thread."""
+        return self._stripes[threading.get_native_id() & _STRIPE_MASK]
+
+    # The helpers below take a key built by _make_key, so callers can build
+    # it before taking a lock. The counter and histogram helpers expect the
+    # caller to hold the stripe's lock; the gauge helper takes its shard's
+    # lock itself. Locks are always taken in the order self.lock, stripe
+    # lock, gauge shard lock.
+
+    def _inc_counter(
+        self, stripe: _MetricStripe, key: _MetricKey, value: float
+    ) -> None:
+        stripe.counters[key] += value
+
+    def _set_gauge(self, key: _MetricKey, value: float) -> None:
+        shard = self._gauge_shards[hash(key) & _STRIPE_MASK]
+        with shard.lock:
+            shard.values[key] = value
 
-    def _make_key(self, name: str, labels: Optional[Dict[str, str]] = None) -> str:
+    def _observe_histogram(
+        self, stripe: _MetricStripe, key: _MetricKey, value: float
+    ) -> None:
+        histogram = stripe.histograms.get(key)
+        if histogram is None:
+            histogram = stripe.histograms[key] = _Histogram()
+        histogram.observe(value)
+
+    def _make_key(
+        self, name: str, labels: Optional[Dict[str, str]] = None
+    ) -> _MetricKey:
         """Create a unique key for metric with labels.
 
+        The key is a tuple that dicts hash natively and that exporters unpack
+        directly, so labels never go through a string round trip.
+
         Args:
             name: Metric name
             labels: Optional labels dictionary
 
         Returns:
-            Unique key string
+            Tuple of the name and its (label, value) pairs sorted by label
         """
-        if not labels:
-            return name
-
         # Sort labels for consistent key generation
-        label_str = ",".join(f"{k}={v}" for k, v in sorted(labels.items()))
-        return f"{name}{{{label_str}}}"
+        return name, _label_items(labels)
 
     def start_operation_timer(self, operation_id: str) -> None:
         """Start timing an operation.
@@ -214,8 +521,12 @@ class MetricsCollector:
         Args:
             operation_id: Unique operation identifier
         """
-        with self.lock:
-            self._operation_start_times[operation_id] = time.time()
+        if not _ENABLED:
+            return
+        start_times = getattr(self._timers, "start_times", None)
+        if start_times is None:
+            start_times = self._register_timer_dict()
+        start_times[operation_id] = time.monotonic_ns()
 
     def end_operation_timer(
         self,
@@ -233,14 +544,49 @@ class MetricsCollector:
         Returns:
             Operation duration in seconds
         """
-        with self.lock:
-            start_time = self._operation_start_times.pop(operation_id, None)
+        if not _ENABLED:
+            return 0.0
+        start_times = getattr(self._timers, "start_times", None)
+        start_time = None
+        if start_times is not None:
+            start_time = start_times.pop(operation_id, None)
+        if start_time is None:
+            # The timer may have been started on another thread
+            start_time = self._pop_foreign_timer(operation_id)
             if start_time is None:
                 return 0.0
 
-            duration = time.time() - start_time
-            self.observe_histogram(metric_name, duration, labels)
-            return duration
+        duration = (time.monotonic_ns() - start_time) / 1e9
+        self.observe_histogram(metric_name, duration, labels)
+        return duration
+
+    def _register_timer_dict(self) -> Dict[str, int]:
+        """Create the calling thread's operation timer dict."""
+        start_times: Dict[str, int] = {}
+        self._timers.start_times = start_times
+        with self.lock:
+            # Drop dicts of finished threads unless a timer is still pending
+            self._timer_dicts = [
+                entry for entry in self._timer_dicts if entry[0].is_alive() or entry[1]
+            ]
+            self._timer_dicts.append((threading.current_thread(), start_times))
+        return start_times
+
+    def _pop_foreign_timer(self, operation_id: str) -> Optional[int]:
+        """Remove and return a start time recorded by any thread.
+
+        Args:
+            operation_id: Unique operation identifier
+
+        Returns:
+            Start time in nanoseconds, or None if no timer was started
+        """
+        with self.lock:
+            for _, start_times in self._timer_dicts:
+                start_time = start_times.pop(operation_id, None)
+                if start_time is not None:
+                    return start_time
+        return None
 
     def record_operation(
         self,
@@ -259,24 +605,104 @@ class MetricsCollector:
             provider: Provider name if applicable
             **extra_labels: Additional labels
         """
-        labels = {"operation": operation}
-        if provider:
-            labels["provider"] = provider
-        labels.update(extra_labels)
+        if not _ENABLED:
+            return
+        # Look up every key up front, then apply all updates under one lock
+        total_key, success_key, failure_key, duration_key = _operation_keys(
+            operation, provider, _label_items(extra_labels)
+        )
+        outcome_key = success_key if success else failure_key
+
+        stripe = self._stripe()
+        with stripe.lock:
+            self._inc_counter(stripe, total_key, 1.0)
+            self._inc_counter(stripe, outcome_key, 1.0)
+            if duration is not None:
+                self._observe_histogram(stripe, duration_key, duration)
+
+    def record_operation_result(
+        self,
+        operation: str,
+        success: bool,
+        duration: Optional[float] = None,
+        provider: Optional[str] = None,
+        error_type: Optional[str] = None,
+    ) -> None:
+        """Record a completed operation and, on failure, the error it raised.
 
-        # Count total operations
-        self.inc_counter("mgit_operations_total", labels=labels)
+        Equivalent to record_operation() followed by record_error() for
+        failures. Results are buffered per thread and applied in batches, so
+        a stripe lock is taken once per batch rather than once per
+        operation; readers apply any pending results before reporting.
 
-        # Count success/failure
-        if success:
-            self.inc_counter("mgit_operations_success_total", labels=labels)
-        else:
-            self.inc_counter("mgit_operations_failure_total", labels=labels)
+        Args:
+            operation: Operation name
+            success: Whether operation succeeded
+            duration: Operation duration in seconds
+            provider: Provider name if applicable
+            error_type: Type of error for failed operations
+        """
+        if not _ENABLED:
+            return
+        buffer = getattr(self._pending, "buffer", None)
+        if buffer is None:
+            buffer = self._register_pending_buffer()
+
+        buffer.append((operation, success, duration, provider, error_type))
+        if len(buffer) >= _RESULT_BATCH_SIZE:
+            self._apply_results(buffer)
+
+    def _register_pending_buffer(self) -> Deque[_OperationResult]:
+        """Create the calling thread's operation result buffer."""
+        buffer: Deque[_OperationResult] = deque()
+        self._pending.buffer = buffer
+        with self.lock:
+            self._pending_buffers.append((threading.current_thread(), buffer))
+        return buffer
 
-        # Record duration if provided
-        if duration is not None:
-            duration_metric = f"mgit_{operation}_duration_seconds"
-            self.observe_histogram(duration_metric, duration, labels)
+    def _apply_results(self, buffer: Deque[_OperationResult]) -> None:
+        """Apply buffered operation results under a single stripe lock.
+
+        Args:
+            buffer: Buffer to drain; it may be drained concurrently by its
+                owning thread and by readers
+        """
+        stripe = self._stripe()
+        with stripe.lock:
+            while True:
+                try:
+                    operation, success, duration, provider, error_type = (
+                        buffer.popleft()
+                    )
+                except IndexError:
+                    break
+
+                total_key, success_key, failure_key, duration_key = _operation_keys(
+                    operation, provider
+                )
+
+                self._inc_counter(stripe, total_key, 1.0)
+                self._inc_counter(stripe, success_key if success else failure_key, 1.0)
+
+                if duration is not None:
+                    self._observe_histogram(stripe, duration_key, duration)
+
+                if not success:
+                    error_key = _operation_error_key(
+                        error_type or "unknown", operation, provider
+                    )
+                    self._inc_counter(stripe, error_key, 1.0)
+
+    def flush_pending(self) -> None:
+        """Apply operation results still buffered by any thread."""
+        with self.lock:
+            entries = self._pending_buffers
+            # Buffers of finished threads are drained below for the last time
+            self._pending_buffers = [entry for entry in entries if entry[0].is_alive()]
+
+        for _, buffer in entries:
+            if buffer:
+                self._apply_results(buffer)
 
     def record_git_operation(
         self,
@@ -293,13 +719,21 @@ class MetricsCollector:
             success: Whether operation succeeded
             duration: Operation duration in seconds
         """
+        if not _ENABLED:
+            return
         labels = {"operation": operation, "repository": repository}
 
-        self.inc_counter("mgit_git_operations_total", labels=labels)
-
+        total_key = self._make_key("mgit_git_operations_total", labels)
         if duration is not None:
-            metric_name = f"mgit_git_{operation}_duration_seconds"
-            self.observe_histogram(metric_name, duration, labels)
+            duration_key = self._make_key(
+                f"mgit_git_{operation}_duration_seconds", labels
+            )
+
+        stripe = self._stripe()
+        with stripe.lock:
+            self._inc_counter(stripe, total_key, 1.0)
+            if duration is not None:
+                self._observe_histogram(stripe, duration_key, duration)
 
     def record_api_call(
         self,
@@ -318,6 +752,8 @@ class MetricsCollector:
             duration: Request duration in seconds
             endpoint: API endpoint (optional)
         """
+        if not _ENABLED:
+            return
         labels = {
             "method": method,
             "provider": provider,
@@ -326,13 +762,20 @@ class MetricsCollector:
         if endpoint:
             labels["endpoint"] = endpoint
 
-        self.inc_counter("mgit_api_requests_total", labels=labels)
-        self.observe_histogram("mgit_api_request_duration_seconds", duration, labels)
-
-        # Record errors
+        requests_key = self._make_key("mgit_api_requests_total", labels)
+        duration_key = self._make_key("mgit_api_request_duration_seconds", labels)
         if status_code >= 400:
             error_labels = {"provider": provider, "status_code": str(status_code)}
-            self.inc_counter("mgit_api_errors_total", labels=error_labels)
+            error_key = self._make_key("mgit_api_errors_total", error_labels)
+
+        stripe = self._stripe()
+        with stripe.lock:
+            self._inc_counter(stripe, requests_key, 1.0)
+            self._observe_histogram(stripe, duration_key, duration)
+
+            # Record errors
+            if status_code >= 400:
+                self._inc_counter(stripe, error_key, 1.0)
 
     def record_authentication(
         self, provider: str, organization: str, success: bool
@@ -344,14 +787,41 @@ class MetricsCollector:
             organization: Organization name
             success: Whether authentication succeeded
         """
+        if not _ENABLED:
+            return
         labels = {"provider": provider, "organization": organization}
 
-        self.inc_counter("mgit_auth_attempts_total", labels=labels)
+        attempts_key = self._make_key("mgit_auth_attempts_total", labels)
+        outcome_metric = (
+            "mgit_auth_success_total" if success else "mgit_auth_failures_total"
+        )
+        outcome_key = self._make_key(outcome_metric, labels)
+
+        stripe = self._stripe()
+        with stripe.lock:
+            self._inc_counter(stripe, attempts_key, 1.0)
+            self._inc_counter(stripe, outcome_key, 1.0)
 
-        if success:
-            self.inc_counter("mgit_auth_success_total", labels=labels)
-        else:
-            self.inc_counter("mgit_auth_failures_total", labels=labels)
+    def record_trace_event(
+        self, operation: str, success: bool, duration: float
+    ) -> None:
+        """Record the metrics of a completed performance trace.
+
+        Args:
+            operation: Operation name
+            success: Whether the operation succeeded
+            duration: Operation duration in seconds
+        """
+        if not _ENABLED:
+            return
+        duration_key, completed_key, error_key = _trace_keys(operation, success)
+
+        stripe = self._stripe()
+        with stripe.lock:
+            self._observe_histogram(stripe, duration_key, duration)
+            self._inc_counter(stripe, completed_key, 1.0)
+            if not success:
+                self._inc_counter(stripe, error_key, 1.0)
 
     def record_provider_operation(self, provider: str, operation: str) -> None:
         """Record a provider operation.
@@ -415,143 +885,149 @@ class MetricsCollector:
         Returns:
             List of metric samples
         """
-        samples = []
+        return [
+            sample for samples in self._collect_samples().values() for sample in samples
+        ]
+
+    def _collect_samples(self) -> Dict[str, List[MetricSample]]:
+        """Take a snapshot of all metrics grouped by base metric name.
+
+        Histogram _bucket, _count and _sum samples are grouped under the
+        histogram's name. Sample labels are inserted in sorted label order,
+        which export_prometheus relies on.
+
+        Returns:
+            Lists of metric samples keyed by base metric name
+        """
+        samples: Dict[str, List[MetricSample]] = defaultdict(list)
+        self.flush_pending()
+
+        # Every sample in a snapshot shares one timestamp
+        timestamp = time.time()
+
+        # Sum the per-thread stripes
+        counters: Dict[_MetricKey, float] = defaultdict(float)
+        histograms: Dict[_MetricKey, _Histogram] = defaultdict(_Histogram)
+        for stripe in self._stripes:
+            with stripe.lock:
+                for key, value in stripe.counters.items():
+                    counters[key] += value
+                for key, histogram in stripe.histograms.items():
+                    histograms[key].merge(histogram)
+
+        gauges: Dict[_MetricKey, float] = {}
+        for shard in self._gauge_shards:
+            with shard.lock:
+                gauges.update(shard.values)
 
         with self.lock:
             # Counters
-            for key, value in self._counters.items():
-                name, labels = self._parse_key(key)
-                samples.append(
+            for (name, label_items), value in counters.items():
+                labels = dict(label_items)
+                samples[name].append(
                     MetricSample(
                         name=name,
                         value=value,
                         labels=labels,
                         help_text=self._metric_help.get(name, ""),
                         metric_type="counter",
+                        timestamp=timestamp,
                     )
                 )
 
             # Gauges
-            for key, value in self._gauges.items():
-                name, labels = self._parse_key(key)
-                samples.append(
+            for (name, label_items), value in gauges.items():
+                labels = dict(label_items)
+                samples[name].append(
                     MetricSample(
                         name=name,
                         value=value,
                         labels=labels,
                         help_text=self._metric_help.get(name, ""),
                         metric_type="gauge",
+                        timestamp=timestamp,
                     )
                 )
 
-            # Histograms (simplified - just count and sum)
-            for key, values in self._histograms.items():
-                name, labels = self._parse_key(key)
-                if values:
-                    # Create histogram buckets (simplified)
-                    count_labels = labels.copy()
-                    count_labels.update({"le": "+Inf"})
-
-                    samples.append(
-                        MetricSample(
-                            name=f"{name}_bucket",
-                            value=len(values),
-                            labels=count_labels,
-                            help_text=self._metric_help.get(name, ""),
-                            metric_type="histogram",
+            # Histograms: cumulative buckets, count and sum
+            for (name, label_items), histogram in histograms.items():
+                labels = dict(label_items)
+                if histogram.count:
+                    help_text = self._metric_help.get(name, "")
+                    cumulative = 0
+                    for bucket_items, bucket_count in zip(
+                        _bucket_label_items(label_items), histogram.buckets
+                    ):
+                        cumulative += bucket_count
+                        samples[name].append(
+                            MetricSample(
+                                name=f"{name}_bucket",
+                                value=cumulative,
+                                labels=dict(bucket_items),
+                                help_text=help_text,
+                                metric_type="histogram",
+                                timestamp=timestamp,
+                            )
                         )
-                    )
 
-                    samples.append(
+                    samples[name].append(
                         MetricSample(
                             name=f"{name}_count",
-                            value=len(values),
+                            value=histogram.count,
                             labels=labels,
-                            help_text=self._metric_help.get(name, ""),
+                            help_text=help_text,
                             metric_type="histogram",
+                            timestamp=timestamp,
                         )
                     )
 
-                    samples.append(
+                    samples[name].append(
                         MetricSample(
                             name=f"{name}_sum",
-                            value=sum(values),
+                            value=histogram.sum,
                             labels=labels,
-                            help_text=self._metric_help.get(name, ""),
+                            help_text=help_text,
                             metric_type="histogram",
+                            timestamp=timestamp,
                         )
                     )
 
         return samples
 
-    def _parse_key(self, key: str) -> Tuple[str, Dict[str, str]]:
-        """Parse a metric key into name and labels.
-
-        Args:
-            key: Metric key
-
-        Returns:
-            Tuple of (name, labels)
-        """
-        if "{" not in key:
-            return key, {}
-
-        name, label_part = key.split("{", 1)
-        label_part = label_part.rstrip("}")
-
-        labels = {}
-        if label_part:
-            for pair in label_part.split(","):
-                if "=" in pair:
-                    k, v = pair.split("=", 1)
-                    labels[k] = v
-
-        return name, labels
-
     def export_prometheus(self) -> str:
         """Export metrics in Prometheus text format.
 
         Returns:
             Prometheus-formatted metrics string
         """
-        samples = self.get_metrics()
-        output = []
-
-        # Group samples by metric name
-        metrics_by_name = defaultdict(list)
-        for sample in samples:
-            base_name = (
-                sample.name.split("_bucket")[0].split("_count")[0].split("_sum")[0]
-            )
-            metrics_by_name[base_name].append(sample)
-
-        for metric_name, metric_samples in metrics_by_name.items():
-            # Add help text
-            if metric_samples and metric_samples[0].help_text:
-                output.append(f"# HELP {metric_name} {metric_samples[0].help_text}")
-
-            # Add type
-            if metric_samples and metric_samples[0].metric_type:
-                output.append(f"# TYPE {metric_name} {metric_samples[0].metric_type}")
-
-            # Add samples
+        output = io.StringIO()
+        write = output.write
+
+        for metric_name, metric_samples in self._collect_samples().items():
+            # Empty line between metrics
+            if output.tell():
+                write("\n")
+
+            # Add help text and type
+            first_sample = metric_samples[0]
+            if first_sample.help_text:
+                write(f"# HELP {metric_name} {first_sample.help_text}\n")
+            if first_sample.metric_type:
+                write(f"# TYPE {metric_name} {first_sample.metric_type}\n")
+
+            # Add samples; labels are already in sorted order
             for sample in metric_samples:
-                label_str = ""
-                if sample.labels:
-                    label_pairs = [
-                        f'{k}="{v}"' for k, v in sorted(sample.labels.items())
-                    ]
-                    label_str = "{" + ",".join(label_pairs) + "}"
-
-                output.append(f"{sample.name}{label_str} {sample.value}")
+                label_str = _render_labels(tuple(sample.labels.items()))
+                write(f"{sample.name}{label_str} {sample.value}\n")
 
-            output.append("")  # Empty line between metrics
+        return output.getvalue()
 
-        return "\n".join(output)
-
-    def export_json(self) -> str:
+    def export_json(self, pretty: bool = False) -> str:
         """Export metrics in JSON format.
 
+        Args:
+            pretty: Indent the output; scrapes use the compact form
+
         Returns:
             JSON-formatted metrics string
         """
@@ -570,22 +1046,51 @@ class MetricsCollector:
                 }
             )
 
-        return json.dumps({"timestamp": time.time(), "metrics": metrics_data}, indent=2)
+        return _dumps_json(
+            {"timestamp": time.time(), "metrics": metrics_data}, pretty=pretty
+        )
 
     def reset_metrics(self) -> None:
         """Reset all metrics to zero/empty."""
+        self.flush_pending()
         with self.lock:
-            self._counters.clear()
-            self._gauges.clear()
-            self._histograms.clear()
-            self._counter_labels.clear()
-            self._gauge_labels.clear()
-            self._histogram_labels.clear()
-            self._operation_start_times.clear()
+            for _, start_times in self._timer_dicts:
+                start_times.clear()
+
+        for stripe in self._stripes:
+            stripe.clear()
+        for shard in self._gauge_shards:
+            shard.clear()
+
+
+def enable_metrics() -> None:
+    """Resume recording metrics after disable_metrics()."""
+    global _ENABLED
+    _ENABLED = True
+
+
+def disable_metrics() -> None:
+    """Stop recording metrics, e.g. to benchmark without their overhead.
+
+    Recording methods return immediately without taking locks. Values that
+    were already recorded are kept and can still be exported.
+    """
+    global _ENABLED
+    _ENABLED = False
+
+
+def metrics_enabled() -> bool:
+    """Check whether metrics are currently being recorded.
+
+    Returns:
+        False after disable_metrics() until enable_metrics() is called
+    """
+    return _ENABLED
 
 
 # Global metrics collector
 _metrics_collector: Optional[MetricsCollector] = None
+_metrics_collector_lock = threading.Lock()
 
 
 def get_metrics_collector() -> MetricsCollector:
@@ -595,9 +1100,15 @@ def get_metrics_collector() -> MetricsCollector:
         MetricsCollector instance
     """
     global _metrics_collector
-    if _metrics_collector is None:
-        _metrics_collector = MetricsCollector()
-    return _metrics_collector
+    collector = _metrics_collector
+    if collector is not None:
+        return collector
+
+    # Create under the lock so concurrent first calls share one instance
+    with _metrics_collector_lock:
+        if _metrics_collector is None:
+            _metrics_collector = MetricsCollector()
+        return _metrics_collector
 
 
 def setup_metrics() -> MetricsCollector:
@@ -607,8 +1118,9 @@ def setup_metrics() -> MetricsCollector:
         Configured MetricsCollector instance
     """
     global _metrics_collector
-    _metrics_collector = MetricsCollector()
-    return _metrics_collector
+    with _metrics_collector_lock:
+        _metrics_collector = MetricsCollector()
+        return _metrics_collector
 
 
 # Convenience functions for common metrics
@@ -4,13 +4,24 @@ This module provides performance monitoring capabilities including
 operation timing, resource usage tracking, and performance analytics.
 """
 
-import statistics
+import itertools
+import logging
+import sys
 import threading
 import time
+from collections import deque
 from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass, field
 from functools import wraps
-from typing import Any, Awaitable, Callable, Dict, List, Optional, TypeVar
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Tuple, TypeVar
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
 
 from .correlation import get_correlation_id
 from .logger import get_structured_logger
@@ -18,8 +29,23 @@ from .metrics import get_metrics_collector
 
 T = TypeVar("T")
 
+# Summaries of at least this many durations use NumPy when it is installed
+_NUMPY_MIN_DURATIONS = 1000
+
+# Recent durations kept per operation name in each shard
+_MAX_OPERATION_DURATIONS = 1000
+
+# Number of trace shards; must be a power of two
+_NUM_SHARDS = 32
+_SHARD_MASK = _NUM_SHARDS - 1
+
+
+# Traces and metrics are created per operation and per summary, so they are
+# slotted where dataclasses support it (Python 3.10+)
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_DATACLASS_OPTIONS)
 class PerformanceTrace:
     """Represents a performance trace for an operation."""
 
@@ -33,9 +59,11 @@ class PerformanceTrace:
     metadata: Dict[str, Any] = field(default_factory=dict)
     parent_id: Optional[str] = None
     children: List[str] = field(default_factory=list)
+    # time.monotonic_ns() at start_time; durations are measured from it
+    start_ns: int = field(default=0, repr=False)
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class PerformanceMetrics:
     """Performance metrics for an operation or time period."""
 
@@ -52,6 +80,74 @@ class PerformanceMetrics:
     success_rate: float
 
 
+def _summarize_durations(
+    operation_name: str, durations: List[float], error_count: int
+) -> PerformanceMetrics:
+    """Compute performance metrics from a non-empty list of durations.
+
+    Only a few order statistics are read, so large lists are partitioned
+    around those ranks with NumPy when it is installed; otherwise the
+    durations are sorted once.
+
+    Args:
+        operation_name: Name of the operation
+        durations: Trace durations in seconds
+        error_count: Number of failed operations
+
+    Returns:
+        Performance metrics for the operation
+    """
+    count = len(durations)
+    middle = count // 2
+    median_ranks = (middle,) if count % 2 else (middle - 1, middle)
+    p95_index = int(0.95 * count)
+    p99_index = int(0.99 * count)
+    ranks = sorted({0, count - 1, p95_index, p99_index, *median_ranks})
+
+    if NUMPY_AVAILABLE and count >= _NUMPY_MIN_DURATIONS:
+        values = np.array(durations, dtype=float)
+        values.partition(ranks)
+        total_duration = float(values.sum())
+        ordered = {rank: float(values[rank]) for rank in ranks}
+    else:
+        sorted_durations = sorted(durations)
+        total_duration = sum(sorted_durations)
+        ordered = {rank: sorted_durations[rank] for rank in ranks}
+
+    return PerformanceMetrics(
+        operation_name=operation_name,
+        count=count,
+        total_duration=total_duration,
+        min_duration=ordered[0],
+        max_duration=ordered[count - 1],
+        avg_duration=total_duration / count,
+        median_duration=sum(ordered[rank] for rank in median_ranks) / len(median_ranks),
+        p95_duration=ordered[p95_index],
+        p99_duration=ordered[p99_index],
+        error_count=error_count,
+        success_rate=((count - error_count) / count) * 100,
+    )
+
+
+class _TraceShard:
+    """Traces whose operation IDs hash to one shard.
+
+    Active traces are inserted, looked up and popped without the lock: each
+    of those is a single dict operation, which the GIL makes atomic in
+    CPython. The lock guards the completed traces and per-operation
+    statistics, which are updated with several operations at a time.
+    """
+
+    __slots__ = ("lock", "traces", "completed", "operation_metrics", "errors")
+
+    def __init__(self, max_completed: int):
+        self.lock = threading.Lock()
+        self.traces: Dict[str, PerformanceTrace] = {}
+        self.completed: Deque[PerformanceTrace] = deque(maxlen=max_completed)
+        self.operation_metrics: Dict[str, Deque[float]] = {}
+        self.errors: Dict[str, int] = {}
+
+
 class PerformanceMonitor:
     """Performance monitoring and instrumentation system."""
 
@@ -67,22 +163,33 @@ class PerformanceMonitor:
         self.logger = get_structured_logger("performance_monitor")
         self.metrics = get_metrics_collector()
 
-        # Thread-safe storage
+        # Traces are sharded by operation ID so concurrent operations rarely
+        # share a lock; max_traces is split evenly across the shards
+        self._shards = [
+            _TraceShard(-(-max_traces // _NUM_SHARDS)) for _ in range(_NUM_SHARDS)
+        ]
+
+        # Guards baseline updates
         self.lock = threading.Lock()
-        self._traces: Dict[str, PerformanceTrace] = {}
-        self._completed_traces: List[PerformanceTrace] = []
-        self._operation_metrics: Dict[str, List[float]] = {}
-        self._operation_errors: Dict[str, int] = {}
 
-        # Current operation stack (for nested operations)
-        self._operation_stack = threading.local()
+        # Current operation stack (for nested operations). A ContextVar gives
+        # each thread and each asyncio task its own stack; the tuple is
+        # replaced rather than modified, so tasks never share one
+        self._operation_stack: ContextVar[Tuple[str, ...]] = ContextVar(
+            "mgit_operation_stack", default=()
+        )
+
+        # Suffixes for generated operation IDs; next() on a count is atomic
+        self._trace_ids = itertools.count(1)
 
         # Performance baselines
         self._baselines: Dict[str, Dict[str, float]] = {}
 
-        # Automatic cleanup
-        self._last_cleanup = time.time()
+        # Automatic cleanup; whichever end_trace call passes the deadline
+        # first runs it while holding the cleanup lock
         self._cleanup_interval = 3600  # 1 hour
+        self._next_cleanup = time.monotonic() + self._cleanup_interval
+        self._cleanup_lock = threading.Lock()
 
     def start_trace(
         self,
@@ -102,37 +209,42 @@ class PerformanceMonitor:
         Returns:
             Operation ID for the trace
         """
+        # Wall time dates the trace; the monotonic clock measures its duration
+        start_time = time.time()
+        start_ns = time.monotonic_ns()
+
         if operation_id is None:
-            operation_id = f"{operation_name}_{int(time.time() * 1000000)}"
+            operation_id = f"{operation_name}_{next(self._trace_ids)}"
 
         correlation_id = get_correlation_id()
 
         # Get parent operation ID if nested
-        parent_id = None
-        if hasattr(self._operation_stack, "stack") and self._operation_stack.stack:
-            parent_id = self._operation_stack.stack[-1]
+        operation_stack = self._operation_stack
+        stack = operation_stack.get()
+        parent_id = stack[-1] if stack else None
 
         trace = PerformanceTrace(
             operation_id=operation_id,
             operation_name=operation_name,
-            start_time=time.time(),
+            start_time=start_time,
             correlation_id=correlation_id,
             tags=tags or {},
             metadata=metadata or {},
             parent_id=parent_id,
+            start_ns=start_ns,
         )
 
-        with self.lock:
-            self._traces[operation_id] = trace
+        shards = self._shards
+        shards[hash(operation_id) & _SHARD_MASK].traces[operation_id] = trace
 
-            # Add to parent's children
-            if parent_id and parent_id in self._traces:
-                self._traces[parent_id].children.append(operation_id)
+        # Add to parent's children
+        if parent_id:
+            parent = shards[hash(parent_id) & _SHARD_MASK].traces.get(parent_id)
+            if parent is not None:
+                parent.children.append(operation_id)
 
         # Add to operation stack
-        if not hasattr(self._operation_stack, "stack"):
-            self._operation_stack.stack = []
-        self._operation_stack.stack.append(operation_id)
+        operation_stack.set(stack + (operation_id,))
 
         # Record start in metrics
         self.metrics.inc_counter(
@@ -140,12 +252,15 @@ class PerformanceMonitor:
             labels={"operation": operation_name},
         )
 
-        self.logger.debug(
-            f"Started performance trace: {operation_name}",
-            operation_id=operation_id,
-            operation_name=operation_name,
-            parent_id=parent_id,
-        )
+        # Skip building the log context when debug logging is off
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                "Started performance trace: %s",
+                operation_name,
+                operation_id=operation_id,
+                operation_name=operation_name,
+                parent_id=parent_id,
+            )
 
         return operation_id
 
@@ -167,87 +282,123 @@ class PerformanceMonitor:
         Returns:
             Operation duration in seconds, or None if trace not found
         """
-        end_time = time.time()
-
-        with self.lock:
-            trace = self._traces.pop(operation_id, None)
-            if not trace:
-                self.logger.warning(
-                    f"Trace not found: {operation_id}", operation_id=operation_id
-                )
-                return None
+        end_ns = time.monotonic_ns()
 
-            # Complete the trace
-            trace.end_time = end_time
-            trace.duration = end_time - trace.start_time
+        shard = self._shards[hash(operation_id) & _SHARD_MASK]
+        trace = shard.traces.pop(operation_id, None)
+        if trace is None:
+            self.logger.warning(
+                "Trace not found: %s", operation_id, operation_id=operation_id
+            )
+            return None
 
-            if additional_metadata:
-                trace.metadata.update(additional_metadata)
+        # Complete the trace; once popped, only this call holds it
+        operation_name = trace.operation_name
+        duration = trace.duration = (end_ns - trace.start_ns) / 1e9
+        trace.end_time = trace.start_time + duration
 
-            if not success and error:
-                trace.metadata["error"] = error
+        if additional_metadata:
+            trace.metadata.update(additional_metadata)
 
-            # Store completed trace
-            self._completed_traces.append(trace)
+        if not success and error:
+            trace.metadata["error"] = error
 
-            # Keep only recent traces
-            if len(self._completed_traces) > self.max_traces:
-                self._completed_traces = self._completed_traces[-self.max_traces :]
+        with shard.lock:
+            # Store completed trace; the deque keeps only recent traces
+            shard.completed.append(trace)
 
-            # Update operation metrics
-            if trace.operation_name not in self._operation_metrics:
-                self._operation_metrics[trace.operation_name] = []
-            self._operation_metrics[trace.operation_name].append(trace.duration)
+            # Update operation metrics; the deque keeps only recent durations
+            durations = shard.operation_metrics.get(operation_name)
+            if durations is None:
+                durations = shard.operation_metrics[operation_name] = deque(
+                    maxlen=_MAX_OPERATION_DURATIONS
+                )
+            durations.append(duration)
 
             # Track errors
             if not success:
-                self._operation_errors[trace.operation_name] = (
-                    self._operation_errors.get(trace.operation_name, 0) + 1
-                )
+                errors = shard.errors
+                errors[operation_name] = errors.get(operation_name, 0) + 1
 
         # Remove from operation stack
-        if (
-            hasattr(self._operation_stack, "stack")
-            and self._operation_stack.stack
-            and self._operation_stack.stack[-1] == operation_id
-        ):
-            self._operation_stack.stack.pop()
-
-        # Record metrics
-        operation_name = trace.operation_name
-        self.metrics.observe_histogram(
-            "mgit_performance_operation_duration_seconds",
-            trace.duration,
-            labels={"operation": operation_name, "success": str(success)},
-        )
-
-        self.metrics.inc_counter(
-            "mgit_performance_operations_completed_total",
-            labels={"operation": operation_name, "success": str(success)},
-        )
-
-        if not success:
-            self.metrics.inc_counter(
-                "mgit_performance_operations_errors_total",
-                labels={"operation": operation_name},
+        operation_stack = self._operation_stack
+        stack = operation_stack.get()
+        if stack and stack[-1] == operation_id:
+            operation_stack.set(stack[:-1])
+
+        # Record metrics under a single collector lock
+        self.metrics.record_trace_event(operation_name, success, duration)
+
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(
+                "Completed performance trace: %s",
+                operation_name,
+                operation_id=operation_id,
+                operation_name=operation_name,
+                duration_seconds=duration,
+                success=success,
+                error=error,
             )
 
-        self.logger.info(
-            f"Completed performance trace: {operation_name}",
-            operation_id=operation_id,
-            operation_name=operation_name,
-            duration_seconds=trace.duration,
-            success=success,
-            error=error,
-        )
-
         # Check for performance anomalies
         self._check_performance_anomalies(trace)
 
         # Cleanup if needed
         self._maybe_cleanup()
 
-        return trace.duration
+        return duration
+
+    def _shard(self, operation_id: str) -> _TraceShard:
+        """Get the shard holding an operation's trace."""
+        return self._shards[hash(operation_id) & _SHARD_MASK]
+
+    def _recent_traces(self, cutoff_time: float) -> List[PerformanceTrace]:
+        """Collect completed traces started after a cutoff from all shards.
+
+        Args:
+            cutoff_time: Timestamp traces must have started after
+
+        Returns:
+            Completed traces with a duration
+        """
+        recent_traces = []
+        for shard in self._shards:
+            with shard.lock:
+                recent_traces.extend(
+                    trace
+                    for trace in shard.completed
+                    if trace.start_time > cutoff_time and trace.duration is not None
+                )
+        return recent_traces
+
+    def _recent_durations(self, operation_name: str, cutoff_time: float) -> List[float]:
+        """Collect durations of one operation's recent traces from all shards.
+
+        Shards that never completed the operation are skipped without
+        scanning their traces.
+
+        Args:
+            operation_name: Name of the operation
+            cutoff_time: Timestamp traces must have started after
+
+        Returns:
+            Durations of the operation's completed traces
+        """
+        durations = []
+        for shard in self._shards:
+            with shard.lock:
+                if operation_name not in shard.operation_metrics:
+                    continue
+                durations.extend(
+                    trace.duration
+                    for trace in shard.completed
+                    if (
+                        trace.operation_name == operation_name
+                        and trace.start_time > cutoff_time
+                        and trace.duration is not None
+                    )
+                )
+        return durations
 
     def get_current_operation_id(self) -> Optional[str]:
         """Get the current operation ID from the stack.
@@ -255,9 +406,8 @@ class PerformanceMonitor:
         Returns:
             Current operation ID or None
         """
-        if hasattr(self._operation_stack, "stack") and self._operation_stack.stack:
-            return self._operation_stack.stack[-1]
-        return None
+        stack = self._operation_stack.get()
+        return stack[-1] if stack else None
 
     def add_trace_metadata(self, operation_id: str, metadata: Dict[str, Any]) -> None:
         """Add metadata to an active trace.
@@ -266,9 +416,9 @@ class PerformanceMonitor:
             operation_id: Operation ID
             metadata: Metadata to add
         """
-        with self.lock:
-            if operation_id in self._traces:
-                self._traces[operation_id].metadata.update(metadata)
+        trace = self._shard(operation_id).traces.get(operation_id)
+        if trace is not None:
+            trace.metadata.update(metadata)
 
     def get_operation_metrics(
         self, operation_name: str, hours: int = 24
@@ -284,62 +434,12 @@ class PerformanceMonitor:
         """
         cutoff_time = time.time() - (hours * 3600)
 
-        with self.lock:
-            # Get recent traces for the operation
-            recent_traces = [
-                trace
-                for trace in self._completed_traces
-                if (
-                    trace.operation_name == operation_name
-                    and trace.start_time > cutoff_time
-                    and trace.duration is not None
-                )
-            ]
-
-            if not recent_traces:
-                return None
-
-            durations = [trace.duration for trace in recent_traces]
-            error_count = self._operation_errors.get(operation_name, 0)
-
-            # Calculate statistics
-            count = len(durations)
-            total_duration = sum(durations)
-            min_duration = min(durations)
-            max_duration = max(durations)
-            avg_duration = statistics.mean(durations)
-            median_duration = statistics.median(durations)
-
-            # Calculate percentiles
-            sorted_durations = sorted(durations)
-            p95_index = int(0.95 * len(sorted_durations))
-            p99_index = int(0.99 * len(sorted_durations))
-            p95_duration = (
-                sorted_durations[p95_index]
-                if p95_index < len(sorted_durations)
-                else max_duration
-            )
-            p99_duration = (
-                sorted_durations[p99_index]
-                if p99_index < len(sorted_durations)
-                else max_duration
-            )
+        durations = self._recent_durations(operation_name, cutoff_time)
+        if not durations:
+            return None
 
-            success_rate = ((count - error_count) / count) * 100 if count > 0 else 0
-
-            return PerformanceMetrics(
-                operation_name=operation_name,
-                count=count,
-                total_duration=total_duration,
-                min_duration=min_duration,
-                max_duration=max_duration,
-                avg_duration=avg_duration,
-                median_duration=median_duration,
-                p95_duration=p95_duration,
-                p99_duration=p99_duration,
-                error_count=error_count,
-                success_rate=success_rate,
-            )
+        error_count = sum(shard.errors.get(operation_name, 0) for shard in self._shards)
+        return _summarize_durations(operation_name, durations, error_count)
 
     def get_all_operations_summary(
         self, hours: int = 24
@@ -354,12 +454,7 @@ class PerformanceMonitor:
         """
         cutoff_time = time.time() - (hours * 3600)
 
-        with self.lock:
-            recent_traces = [
-                trace
-                for trace in self._completed_traces
-                if trace.start_time > cutoff_time and trace.duration is not None
-            ]
+        recent_traces = self._recent_traces(cutoff_time)
 
         # Group by operation name
         operations = {}
@@ -374,43 +469,9 @@ class PerformanceMonitor:
             durations = [trace.duration for trace in traces]
             error_count = sum(1 for trace in traces if "error" in trace.metadata)
 
-            if durations:
-                count = len(durations)
-                total_duration = sum(durations)
-                min_duration = min(durations)
-                max_duration = max(durations)
-                avg_duration = statistics.mean(durations)
-                median_duration = statistics.median(durations)
-
-                sorted_durations = sorted(durations)
-                p95_index = int(0.95 * len(sorted_durations))
-                p99_index = int(0.99 * len(sorted_durations))
-                p95_duration = (
-                    sorted_durations[p95_index]
-                    if p95_index < len(sorted_durations)
-                    else max_duration
-                )
-                p99_duration = (
-                    sorted_durations[p99_index]
-                    if p99_index < len(sorted_durations)
-                    else max_duration
-                )
-
-                success_rate = ((count - error_count) / count) * 100 if count > 0 else 0
-
-                summary[operation_name] = PerformanceMetrics(
-                    operation_name=operation_name,
-                    count=count,
-                    total_duration=total_duration,
-                    min_duration=min_duration,
-                    max_duration=max_duration,
-                    avg_duration=avg_duration,
-                    median_duration=median_duration,
-                    p95_duration=p95_duration,
-                    p99_duration=p99_duration,
-                    error_count=error_count,
-                    success_rate=success_rate,
-                )
+            summary[operation_name] = _summarize_durations(
+                operation_name, durations, error_count
+            )
 
         return summary
 
@@ -440,9 +501,9 @@ class PerformanceMonitor:
         """
         operation_name = trace.operation_name
 
-        # Check against baseline if available
-        with self.lock:
-            baseline = self._baselines.get(operation_name)
+        # Check against baseline if available; baselines are replaced whole,
+        # so reading one needs no lock
+        baseline = self._baselines.get(operation_name)
 
         if baseline and trace.duration:
             # Check if duration exceeds baseline thresholds
@@ -481,36 +542,42 @@ class PerformanceMonitor:
 
     def _maybe_cleanup(self) -> None:
         """Clean up old performance data if needed."""
-        current_time = time.time()
+        if time.monotonic() < self._next_cleanup:
+            return
 
-        if current_time - self._last_cleanup > self._cleanup_interval:
-            self._cleanup_old_data()
-            self._last_cleanup = current_time
+        # Other callers carry on instead of waiting or cleaning up again
+        if not self._cleanup_lock.acquire(blocking=False):
+            return
+        try:
+            now = time.monotonic()
+            if now >= self._next_cleanup:
+                self._next_cleanup = now + self._cleanup_interval
+                self._cleanup_old_data()
+        finally:
+            self._cleanup_lock.release()
 
     def _cleanup_old_data(self) -> None:
         """Clean up old performance data."""
         cutoff_time = time.time() - (self.retention_hours * 3600)
 
-        with self.lock:
-            # Remove old completed traces
-            self._completed_traces = [
-                trace
-                for trace in self._completed_traces
-                if trace.start_time > cutoff_time
-            ]
-
-            # Clean up operation metrics
-            for operation_name in list(self._operation_metrics.keys()):
-                # Keep only recent durations (this is approximate)
-                if len(self._operation_metrics[operation_name]) > 1000:
-                    self._operation_metrics[operation_name] = self._operation_metrics[
-                        operation_name
-                    ][-500:]
+        traces_count = 0
+        for shard in self._shards:
+            with shard.lock:
+                # Remove old completed traces
+                shard.completed = deque(
+                    (
+                        trace
+                        for trace in shard.completed
+                        if trace.start_time > cutoff_time
+                    ),
+                    maxlen=shard.completed.maxlen,
+                )
+                traces_count += len(shard.completed)
 
         self.logger.debug(
             "Cleaned up old performance data",
             cutoff_time=cutoff_time,
-            traces_count=len(self._completed_traces),
+            traces_count=traces_count,
         )
 
     @contextmanager
@@ -600,9 +667,16 @@ def monitor_performance(
 
         @wraps(func)
         def wrapper(*args, **kwargs) -> T:
+            # Same as trace_operation, without the generator context manager
             monitor = get_performance_monitor()
-            with monitor.trace_operation(actual_operation_name, tags=tags):
-                return func(*args, **kwargs)
+            operation_id = monitor.start_trace(actual_operation_name, tags=tags)
+            try:
+                result = func(*args, **kwargs)
+            except Exception as e:
+                monitor.end_trace(operation_id, success=False, error=str(e))
+                raise
+            monitor.end_trace(operation_id, success=True)
+            return result
 
         return wrapper
 
@@ -624,9 +698,16 @@ def monitor_async_performance(
 
         @wraps(func)
         async def wrapper(*args, **kwargs) -> T:
+            # Same as async_trace_operation, without the context manager
             monitor = get_performance_monitor()
-            async with monitor.async_trace_operation(actual_operation_name, tags=tags):
-                return await func(*args, **kwargs)
+            operation_id = monitor.start_trace(actual_operation_name, tags=tags)
+            try:
+                result = await func(*args, **kwargs)
+            except Exception as e:
+                monitor.end_trace(operation_id, success=False, error=str(e))
+                raise
+            monitor.end_trace(operation_id, success=True)
+            return result
 
         return wrapper
 
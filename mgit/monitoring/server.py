@@ -4,11 +4,14 @@ This module provides a lightweight HTTP server for exposing
 Prometheus metrics and health check endpoints.
 """
 
+import asyncio
 import json
+import logging
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Dict, Optional, Tuple
 
 try:
     from aiohttp import web
@@ -24,12 +27,126 @@ from urllib.parse import urlparse
 
 from .health import get_health_checker
 from .logger import get_structured_logger
-from .metrics import get_metrics_collector
+from .metrics import get_metrics_collector, metrics_enabled
+
+# Content type of the Prometheus text exposition format
+_PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Metrics exports are reused for this long, so bursts of scrapes share one
+_EXPORT_CACHE_TTL = 1.0  # seconds
+
+# Guards creation of MonitoringServer's shared export executor
+_export_executor_lock = threading.Lock()
+
+
+# Local ISO timestamp reported by the endpoints, with the second it was made for
+_last_iso: Tuple[int, str] = (0, "")
+
+
+def _now_iso() -> str:
+    """Get the current local time for response payloads.
+
+    The timestamp has one second resolution and is formatted once per second,
+    so health probes hitting the server in bursts reuse the same string.
+
+    Returns:
+        ISO 8601 local timestamp
+    """
+    global _last_iso
+    second = int(time.time())
+    last_second, formatted = _last_iso
+    if second != last_second:
+        formatted = datetime.fromtimestamp(second).isoformat()
+        _last_iso = (second, formatted)
+    return formatted
+
+
+def _encode_export(export: Callable[[], str]) -> bytes:
+    """Render a metrics export and encode it for the response body.
+
+    Args:
+        export: Function rendering the export
+
+    Returns:
+        UTF-8 encoded export
+    """
+    return export().encode("utf-8")
+
+
+# Welcome page served at /, kept as bytes so requests skip encoding
+_ROOT_HTML = b"""
+<!DOCTYPE html>
+<html>
+<head>
+    <title>mgit Monitoring</title>
+    <style>
+        body { font-family: Arial, sans-serif; margin: 40px; }
+        .endpoint { margin: 10px 0; }
+        .endpoint a { text-decoration: none; color: #0066cc; }
+        .endpoint a:hover { text-decoration: underline; }
+        .description { color: #666; font-size: 0.9em; margin-left: 20px; }
+    </style>
+</head>
+<body>
+    <h1>mgit Monitoring</h1>
+    <p>Multi-Git Tool monitoring and observability endpoints.</p>
+    
+    <h2>Available Endpoints</h2>
+    
+    <div class="endpoint">
+        <a href="/metrics">/metrics</a>
+        <div class="description">Prometheus metrics (text format)</div>
+    </div>
+    
+    <div class="endpoint">
+        <a href="/metrics/json">/metrics/json</a>
+        <div class="description">Metrics in JSON format</div>
+    </div>
+    
+    <div class="endpoint">
+        <a href="/health">/health</a>
+        <div class="description">Overall health status</div>
+    </div>
+    
+    <div class="endpoint">
+        <a href="/health/ready">/health/ready</a>
+        <div class="description">Readiness probe (Kubernetes)</div>
+    </div>
+    
+    <div class="endpoint">
+        <a href="/health/live">/health/live</a>
+        <div class="description">Liveness probe (Kubernetes)</div>
+    </div>
+    
+    <div class="endpoint">
+        <a href="/health/detailed">/health/detailed</a>
+        <div class="description">Detailed health check results</div>
+    </div>
+    
+    <div class="endpoint">
+        <a href="/info">/info</a>
+        <div class="description">Application information</div>
+    </div>
+    
+    <div class="endpoint">
+        <a href="/status">/status</a>
+        <div class="description">Simple status check</div>
+    </div>
+    
+    <h2>Usage</h2>
+    <p>Configure your monitoring system to scrape <code>/metrics</code> for Prometheus metrics.</p>
+    <p>Use <code>/health/ready</code> and <code>/health/live</code> for Kubernetes probes.</p>
+</body>
+</html>
+"""
 
 
 class MonitoringServer:
     """HTTP server for monitoring endpoints."""
 
+    # Single worker rendering metrics exports, so at most one runs at a time
+    _export_executor: Optional[ThreadPoolExecutor] = None
+
     def __init__(self, host: str = "127.0.0.1", port: int = 8080):
         """Initialize monitoring server.
 
@@ -52,6 +169,14 @@ class MonitoringServer:
         self._request_count = 0
         self._start_time = time.time()
 
+        # Encoded metrics exports by format, with their monotonic render time
+        self._export_cache: Dict[str, Tuple[float, bytes]] = {}
+        # In-flight renders by format, shared by concurrent scrapes
+        self._export_tasks: Dict[str, "asyncio.Future[bytes]"] = {}
+
+        # Parts of the /info response that never change, built on first use
+        self._info_static: Optional[Dict[str, Any]] = None
+
     async def start(self) -> None:
         """Start the monitoring server."""
         if not AIOHTTP_AVAILABLE:
@@ -127,17 +252,20 @@ class MonitoringServer:
 
         self.logger.info("Monitoring server stopped")
 
+    @web.middleware
     async def _request_middleware(
         self, request: Request, handler: Callable
     ) -> Response:
         """Middleware for request logging and metrics."""
-        start_time = time.time()
         self._request_count += 1
+        log_enabled = self.logger.isEnabledFor(logging.INFO)
+        timed = log_enabled or metrics_enabled()
+        if timed:
+            start_time = time.monotonic()
 
         # Extract request info
         method = request.method
         path = request.path
-        user_agent = request.headers.get("User-Agent", "")
 
         try:
             response = await handler(request)
@@ -155,8 +283,11 @@ class MonitoringServer:
             success = False
             response = web.json_response({"error": "Internal server error"}, status=500)
 
+        if not timed:
+            return response
+
         # Calculate duration
-        duration = time.time() - start_time
+        duration = time.monotonic() - start_time
 
         # Record metrics
         self.metrics.record_api_call(
@@ -168,25 +299,90 @@ class MonitoringServer:
         )
 
         # Log request
-        self.logger.info(
-            f"{method} {path} -> {status_code}",
-            method=method,
-            path=path,
-            status_code=status_code,
-            duration_ms=duration * 1000,
-            user_agent=user_agent,
-            success=success,
-        )
+        if log_enabled:
+            self.logger.info(
+                "%s %s -> %s",
+                method,
+                path,
+                status_code,
+                method=method,
+                path=path,
+                status_code=status_code,
+                duration_ms=duration * 1000,
+                user_agent=request.headers.get("User-Agent", ""),
+                success=success,
+            )
 
         return response
 
+    async def _cached_export(self, key: str, export: Callable[[], str]) -> bytes:
+        """Get an encoded metrics export, rendering it at most once per TTL.
+
+        Rendering runs in a worker thread so it does not block the event loop,
+        and requests arriving while a render is in flight await that render.
+
+        Args:
+            key: Cache key of the export format
+            export: Function rendering the export
+
+        Returns:
+            UTF-8 encoded export
+        """
+        cached = self._export_cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < _EXPORT_CACHE_TTL:
+            return cached[1]
+
+        task = self._export_tasks.get(key)
+        if task is None or task.done():
+            task = asyncio.ensure_future(self._render_export(key, export))
+            self._export_tasks[key] = task
+        return await asyncio.shield(task)
+
+    @classmethod
+    def _get_export_executor(cls) -> ThreadPoolExecutor:
+        """Get the executor used to render metrics exports.
+
+        Returns:
+            ThreadPoolExecutor instance
+        """
+        executor = cls._export_executor
+        if executor is not None:
+            return executor
+
+        # Create under the lock so servers on other threads share one worker
+        with _export_executor_lock:
+            if cls._export_executor is None:
+                cls._export_executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="mgit-metrics-export"
+                )
+            return cls._export_executor
+
+    async def _render_export(self, key: str, export: Callable[[], str]) -> bytes:
+        """Render and encode a metrics export off the event loop and cache it.
+
+        Args:
+            key: Cache key of the export format
+            export: Function rendering the export
+
+        Returns:
+            UTF-8 encoded export
+        """
+        loop = asyncio.get_running_loop()
+        payload = await loop.run_in_executor(
+            self._get_export_executor(), _encode_export, export
+        )
+        self._export_cache[key] = (time.monotonic(), payload)
+        return payload
+
     async def _metrics_handler(self, request: Request) -> Response:
         """Handle /metrics endpoint (Prometheus format)."""
         try:
-            metrics_text = self.metrics.export_prometheus()
+            payload = await self._cached_export(
+                "prometheus", self.metrics.export_prometheus
+            )
+            # The charset is part of the header, which content_type= rejects
             return Response(
-                text=metrics_text,
-                content_type="text/plain; version=0.0.4; charset=utf-8",
+                body=payload, headers={"Content-Type": _PROMETHEUS_CONTENT_TYPE}
             )
         except Exception as e:
             self.logger.error(f"Error exporting metrics: {str(e)}")
@@ -195,8 +391,8 @@ class MonitoringServer:
     async def _metrics_json_handler(self, request: Request) -> Response:
         """Handle /metrics/json endpoint (JSON format)."""
         try:
-            metrics_json = self.metrics.export_json()
-            return Response(text=metrics_json, content_type="application/json")
+            payload = await self._cached_export("json", self.metrics.export_json)
+            return Response(body=payload, content_type="application/json")
         except Exception as e:
             self.logger.error(f"Error exporting metrics JSON: {str(e)}")
             return web.json_response({"error": "Failed to export metrics"}, status=500)
@@ -215,7 +411,7 @@ class MonitoringServer:
                 {
                     "status": "error",
                     "message": f"Health check failed: {str(e)}",
-                    "timestamp": datetime.now().isoformat(),
+                    "timestamp": _now_iso(),
                 },
                 status=500,
             )
@@ -227,12 +423,12 @@ class MonitoringServer:
 
             if is_ready:
                 return web.json_response(
-                    {"status": "ready", "timestamp": datetime.now().isoformat()},
+                    {"status": "ready", "timestamp": _now_iso()},
                     status=200,
                 )
             else:
                 return web.json_response(
-                    {"status": "not_ready", "timestamp": datetime.now().isoformat()},
+                    {"status": "not_ready", "timestamp": _now_iso()},
                     status=503,
                 )
 
@@ -242,7 +438,7 @@ class MonitoringServer:
                 {
                     "status": "error",
                     "message": f"Readiness check failed: {str(e)}",
-                    "timestamp": datetime.now().isoformat(),
+                    "timestamp": _now_iso(),
                 },
                 status=500,
             )
@@ -254,12 +450,12 @@ class MonitoringServer:
 
             if is_alive:
                 return web.json_response(
-                    {"status": "alive", "timestamp": datetime.now().isoformat()},
+                    {"status": "alive", "timestamp": _now_iso()},
                     status=200,
                 )
             else:
                 return web.json_response(
-                    {"status": "not_alive", "timestamp": datetime.now().isoformat()},
+                    {"status": "not_alive", "timestamp": _now_iso()},
                     status=503,
                 )
 
@@ -269,7 +465,7 @@ class MonitoringServer:
                 {
                     "status": "error",
                     "message": f"Liveness check failed: {str(e)}",
-                    "timestamp": datetime.now().isoformat(),
+                    "timestamp": _now_iso(),
                 },
                 status=500,
             )
@@ -288,7 +484,7 @@ class MonitoringServer:
                 {
                     "status": "error",
                     "message": f"Detailed health check failed: {str(e)}",
-                    "timestamp": datetime.now().isoformat(),
+                    "timestamp": _now_iso(),
                 },
                 status=500,
             )
@@ -296,33 +492,37 @@ class MonitoringServer:
     async def _info_handler(self, request: Request) -> Response:
         """Handle /info endpoint."""
         try:
-            from ..constants import __version__
-
-            uptime = time.time() - self._start_time
+            info_static = self._info_static
+            if info_static is None:
+                from ..constants import __version__
+
+                info_static = self._info_static = {
+                    "application": "mgit",
+                    "version": __version__,
+                    "start_time": datetime.fromtimestamp(self._start_time).isoformat(),
+                    "monitoring": {
+                        "metrics_enabled": True,
+                        "health_checks_enabled": True,
+                        "structured_logging": True,
+                        "performance_monitoring": True,
+                    },
+                    "endpoints": {
+                        "metrics": "/metrics",
+                        "metrics_json": "/metrics/json",
+                        "health": "/health",
+                        "readiness": "/health/ready",
+                        "liveness": "/health/live",
+                        "detailed_health": "/health/detailed",
+                        "status": "/status",
+                        "info": "/info",
+                    },
+                }
 
             info_data = {
-                "application": "mgit",
-                "version": __version__,
-                "uptime_seconds": uptime,
-                "start_time": datetime.fromtimestamp(self._start_time).isoformat(),
-                "current_time": datetime.now().isoformat(),
+                **info_static,
+                "uptime_seconds": time.time() - self._start_time,
+                "current_time": _now_iso(),
                 "request_count": self._request_count,
-                "monitoring": {
-                    "metrics_enabled": True,
-                    "health_checks_enabled": True,
-                    "structured_logging": True,
-                    "performance_monitoring": True,
-                },
-                "endpoints": {
-                    "metrics": "/metrics",
-                    "metrics_json": "/metrics/json",
-                    "health": "/health",
-                    "readiness": "/health/ready",
-                    "liveness": "/health/live",
-                    "detailed_health": "/health/detailed",
-                    "status": "/status",
-                    "info": "/info",
-                },
             }
 
             return web.json_response(info_data)
@@ -343,7 +543,7 @@ class MonitoringServer:
             status_data = {
                 "status": "ok" if is_healthy else "degraded",
                 "healthy": is_healthy,
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": _now_iso(),
                 "uptime_seconds": time.time() - self._start_time,
             }
 
@@ -356,80 +556,16 @@ class MonitoringServer:
                     "status": "error",
                     "healthy": False,
                     "message": f"Status check failed: {str(e)}",
-                    "timestamp": datetime.now().isoformat(),
+                    "timestamp": _now_iso(),
                 },
                 status=500,
             )
 
     async def _root_handler(self, request: Request) -> Response:
         """Handle / endpoint (welcome page)."""
-        html_content = """
-<!DOCTYPE html>
-<html>
-<head>
-    <title>mgit Monitoring</title>
-    <style>
-        body { font-family: Arial, sans-serif; margin: 40px; }
-        .endpoint { margin: 10px 0; }
-        .endpoint a { text-decoration: none; color: #0066cc; }
-        .endpoint a:hover { text-decoration: underline; }
-        .description { color: #666; font-size: 0.9em; margin-left: 20px; }
-    </style>
-</head>
-<body>
-    <h1>mgit Monitoring</h1>
-    <p>Multi-Git Tool monitoring and observability endpoints.</p>
-    
-    <h2>Available Endpoints</h2>
-    
-    <div class="endpoint">
-        <a href="/metrics">/metrics</a>
-        <div class="description">Prometheus metrics (text format)</div>
-    </div>
-    
-    <div class="endpoint">
-        <a href="/metrics/json">/metrics/json</a>
-        <div class="description">Metrics in JSON format</div>
-    </div>
-    
-    <div class="endpoint">
-        <a href="/health">/health</a>
-        <div class="description">Overall health status</div>
-    </div>
-    
-    <div class="endpoint">
-        <a href="/health/ready">/health/ready</a>
-        <div class="description">Readiness probe (Kubernetes)</div>
-    </div>
-    
-    <div class="endpoint">
-        <a href="/health/live">/health/live</a>
-        <div class="description">Liveness probe (Kubernetes)</div>
-    </div>
-    
-    <div class="endpoint">
-        <a href="/health/detailed">/health/detailed</a>
-        <div class="description">Detailed health check results</div>
-    </div>
-    
-    <div class="endpoint">
-        <a href="/info">/info</a>
-        <div class="description">Application information</div>
-    </div>
-    
-    <div class="endpoint">
-        <a href="/status">/status</a>
-        <div class="description">Simple status check</div>
-    </div>
-    
-    <h2>Usage</h2>
-    <p>Configure your monitoring system to scrape <code>/metrics</code> for Prometheus metrics.</p>
-    <p>Use <code>/health/ready</code> and <code>/health/live</code> for Kubernetes probes.</p>
-</body>
-</html>
-        """
-
-        return Response(text=html_content, content_type="text/html")
+        return Response(
+            body=_ROOT_HTML, headers={"Content-Type": "text/html; charset=utf-8"}
+        )
 
 
 # Simple fallback server for environments without aiohttp
@@ -497,7 +633,7 @@ class SimpleMonitoringServer:
                     # Simplified synchronous health check
                     health_data = {
                         "status": "healthy",
-                        "timestamp": datetime.now().isoformat(),
+                        "timestamp": _now_iso(),
                     }
                     self._send_json_response(200, health_data)
                 except Exception as e:
@@ -505,12 +641,12 @@ class SimpleMonitoringServer:
 
             def _handle_readiness(self):
                 self._send_json_response(
-                    200, {"status": "ready", "timestamp": datetime.now().isoformat()}
+                    200, {"status": "ready", "timestamp": _now_iso()}
                 )
 
             def _handle_liveness(self):
                 self._send_json_response(
-                    200, {"status": "alive", "timestamp": datetime.now().isoformat()}
+                    200, {"status": "alive", "timestamp": _now_iso()}
                 )
 
             def _handle_info(self):
@@ -520,7 +656,7 @@ class SimpleMonitoringServer:
                     info_data = {
                         "application": "mgit",
                         "version": __version__,
-                        "timestamp": datetime.now().isoformat(),
+                        "timestamp": _now_iso(),
                         "monitoring": "simple_server",
                     }
                     self._send_json_response(200, info_data)
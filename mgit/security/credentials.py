@@ -4,14 +4,40 @@ This module provides secure credential management, masking, and validation
 to prevent credential exposure in logs, error messages, and API responses.
 """
 
+import bisect
 import logging
 import re
 from functools import wraps
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional, Pattern
 from urllib.parse import parse_qs, urlencode, urlparse, urlunparse
 
 logger = logging.getLogger(__name__)
 
+# Quotes delimiting strings in JSON text without escapes, and the colon that
+# follows a closing quote when the string is an object key
+_JSON_QUOTE_PATTERN = re.compile('"')
+_JSON_KEY_SUFFIX_PATTERN = re.compile(r"\s*:")
+
+
+def _combine_patterns(patterns: Dict[str, Pattern]) -> Pattern:
+    """Combine credential patterns into a single alternation.
+
+    Each pattern keeps its own case-insensitivity through a scoped inline
+    flag, so the combined pattern matches exactly where any of the
+    individual patterns would.
+
+    Args:
+        patterns: Compiled patterns keyed by name
+
+    Returns:
+        Compiled pattern matching any of the given patterns
+    """
+    alternatives = []
+    for name, pattern in patterns.items():
+        flags = "i" if pattern.flags & re.IGNORECASE else ""
+        alternatives.append(f"(?P<{name}>(?{flags}:{pattern.pattern}))")
+    return re.compile("|".join(alternatives))
+
 
 class CredentialMasker:
     """Handles masking of sensitive credentials in various contexts."""
@@ -30,6 +56,9 @@ class CredentialMasker:
         "base64_credentials": re.compile(r"\bBasic\s+[A-Za-z0-9+/]+=*", re.IGNORECASE),
     }
 
+    # Single pattern used to skip strings that contain no credentials
+    ANY_CREDENTIAL_PATTERN = _combine_patterns(CREDENTIAL_PATTERNS)
+
     # Sensitive field names that should be masked
     SENSITIVE_FIELDS = {
         "token",
@@ -71,6 +100,10 @@ class CredentialMasker:
         if not text or not isinstance(text, str):
             return text
 
+        # One scan rules out every pattern for the common credential-free text
+        if not self.ANY_CREDENTIAL_PATTERN.search(text):
+            return text
+
         masked_text = text
 
         # Apply each credential pattern
@@ -79,6 +112,53 @@ class CredentialMasker:
 
         return masked_text
 
+    def mask_json_text(self, text: str) -> Optional[str]:
+        """Mask credentials inside the string values of serialized JSON.
+
+        The text must contain no escape sequences, so that every JSON string
+        appears verbatim between its quotes and the quotes alone delimit the
+        strings. Credentials are then masked in place without parsing the
+        document.
+
+        Args:
+            text: Serialized JSON without backslash escapes
+
+        Returns:
+            Masked JSON text, or None if a credential pattern matched outside
+            a string value (across quotes, in a key or in a number) and the
+            values must be masked individually
+        """
+        outside_value = False
+        masked_text = text
+        quotes: List[int] = []
+
+        def mask_within_value(match: re.Match) -> str:
+            nonlocal outside_value
+            start, end = match.span()
+            # Strings open at even quote indexes, so an odd count of quotes
+            # before the match places it inside a string
+            index = bisect.bisect_left(quotes, start)
+            if (
+                index % 2 == 0
+                or index == len(quotes)
+                or quotes[index] < end
+                or _JSON_KEY_SUFFIX_PATTERN.match(masked_text, quotes[index] + 1)
+            ):
+                outside_value = True
+                return match.group(0)
+            return self._mask_match(match)
+
+        quoted_text = None
+        for pattern in self.CREDENTIAL_PATTERNS.values():
+            if masked_text is not quoted_text:
+                quotes = [m.start() for m in _JSON_QUOTE_PATTERN.finditer(masked_text)]
+                quoted_text = masked_text
+            masked_text = pattern.sub(mask_within_value, masked_text)
+            if outside_value:
+                return None
+
+        return masked_text
+
     def mask_url(self, url: str) -> str:
         """Mask credentials in URLs.
 
@@ -364,14 +444,8 @@ def is_credential_exposed(text: str) -> bool:
     if not text or not isinstance(text, str):
         return False
 
-    masker = CredentialMasker()
-
-    # Check against all credential patterns
-    for pattern in masker.CREDENTIAL_PATTERNS.values():
-        if pattern.search(text):
-            return True
-
-    return False
+    # Check against all credential patterns at once
+    return CredentialMasker.ANY_CREDENTIAL_PATTERN.search(text) is not None
 
 
 def sanitize_for_logging(data: Any) -> Any:
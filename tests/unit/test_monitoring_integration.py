@@ -0,0 +1,111 @@
+"""Unit tests for the monitoring decorators."""
+
+from unittest.mock import patch
+
+import pytest
+
+from mgit.monitoring.integration import (
+    monitor_git_operation,
+    monitor_provider_api_call,
+)
+from mgit.monitoring.metrics import get_metrics_collector
+from mgit.monitoring.performance import get_performance_monitor
+
+
+class TestMonitorGitOperation:
+    """Test cases for the git operation decorator."""
+
+    def test_unhashable_repository_argument(self):
+        """Test that a non-string repository does not break the call."""
+
+        @monitor_git_operation("clone")
+        def clone(repository, destination):
+            return destination
+
+        repository = {"name": "test-repo", "url": "https://example.com/test-repo"}
+        assert clone(repository, "/tmp/test-repo") == "/tmp/test-repo"
+
+    def test_unhashable_repository_argument_on_failure(self):
+        """Test that a failing call with a non-string repository re-raises."""
+
+        @monitor_git_operation("pull")
+        def pull(repository):
+            raise RuntimeError("pull failed")
+
+        with pytest.raises(RuntimeError, match="pull failed"):
+            pull(["not", "hashable"])
+
+    def test_trace_tags_are_built_per_call(self):
+        """Test that each trace receives its own repository tags."""
+        monitor = get_performance_monitor()
+        with patch.object(
+            monitor, "start_trace", wraps=monitor.start_trace
+        ) as start_trace:
+
+            @monitor_git_operation("fetch")
+            def fetch(repository):
+                return repository
+
+            fetch("test-repo")
+            fetch("test-repo")
+
+        first, second = (call.kwargs["tags"] for call in start_trace.call_args_list)
+        assert first == second == {"repository": "test-repo"}
+        assert first is not second
+
+
+class _GitHubClient:
+    """Provider stand-in naming its provider on the class."""
+
+    provider_name = "github"
+
+
+class _ConfiguredClient:
+    """Provider stand-in naming its provider per instance."""
+
+    def __init__(self, provider_name):
+        self.provider_name = provider_name
+
+
+class TestMonitorProviderApiCall:
+    """Test cases for the provider API call decorator."""
+
+    def _reported_providers(self, func, *calls):
+        """Decorate func and return the providers its calls were recorded for."""
+        metrics = get_metrics_collector()
+        with patch.object(metrics, "record_api_call") as record_api_call:
+            wrapped = monitor_provider_api_call(endpoint="/repos")(func)
+            for args in calls:
+                wrapped(*args)
+        return [call.kwargs["provider"] for call in record_api_call.call_args_list]
+
+    def test_plain_function_reports_provider_of_first_argument(self):
+        """Test that a non-method labels calls with its client's provider."""
+
+        def list_repos(client):
+            return []
+
+        assert self._reported_providers(list_repos, (_GitHubClient(),)) == ["github"]
+
+    def test_method_reports_provider_of_instance(self):
+        """Test that a method labels calls with its instance's provider."""
+
+        class Client(_GitHubClient):
+            def list_repos(self):
+                return []
+
+        client = Client()
+        assert self._reported_providers(Client.list_repos, (client,)) == ["github"]
+
+    def test_instance_provider_names_are_read_per_call(self):
+        """Test that provider names set on instances are not cached by type."""
+
+        def list_repos(client):
+            return []
+
+        providers = self._reported_providers(
+            list_repos,
+            (_ConfiguredClient("ado_myorg"),),
+            (_ConfiguredClient("github_work"),),
+        )
+        assert providers == ["ado_myorg", "github_work"]
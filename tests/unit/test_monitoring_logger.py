@@ -0,0 +1,139 @@
+"""Unit tests for queued structured logging."""
+
+import logging
+import queue
+import threading
+
+import pytest
+
+from mgit.monitoring.logger import (
+    _RingBufferQueue,
+    flush_queue_logging,
+    start_queue_logging,
+    stop_queue_logging,
+)
+
+
+class _CollectingHandler(logging.Handler):
+    """Handler that keeps the messages of the records it handles."""
+
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+
+@pytest.fixture
+def queued_root_logger():
+    """Route the root logger through the queue listener for one test."""
+    root_logger = logging.getLogger()
+    saved_handlers = list(root_logger.handlers)
+    saved_level = root_logger.level
+
+    handler = _CollectingHandler()
+    root_logger.handlers = [handler]
+    root_logger.setLevel(logging.INFO)
+    start_queue_logging()
+    try:
+        yield handler
+    finally:
+        stop_queue_logging()
+        root_logger.handlers = saved_handlers
+        root_logger.setLevel(saved_level)
+
+
+class TestRingBufferQueue:
+    """Test cases for the drop-oldest log record queue."""
+
+    def test_overflow_drops_oldest_records(self):
+        """Test that a full queue evicts its oldest records and counts them."""
+        log_queue = _RingBufferQueue(3)
+        for index in range(5):
+            log_queue.put_nowait(index)
+
+        assert log_queue.dropped == 2
+        assert [log_queue.get(block=False) for _ in range(3)] == [2, 3, 4]
+        with pytest.raises(queue.Empty):
+            log_queue.get(block=False)
+
+    def test_control_items_in_order_with_records(self):
+        """Test that control items follow exactly the records queued before."""
+        log_queue = _RingBufferQueue(10)
+        log_queue.put_nowait("first")
+        log_queue.put_control("marker")
+        log_queue.put_nowait("second")
+        log_queue.put_control("sentinel")
+        log_queue.put_nowait("third")
+
+        items = [log_queue.get(block=False) for _ in range(5)]
+        assert items == ["first", "marker", "second", "sentinel", "third"]
+        assert log_queue.empty()
+
+    def test_control_items_survive_overflow(self):
+        """Test that evicting records never drops a control item."""
+        log_queue = _RingBufferQueue(2)
+        log_queue.put_nowait("old")
+        log_queue.put_control("marker")
+        for index in range(4):
+            log_queue.put_nowait(index)
+
+        items = [log_queue.get(block=False) for _ in range(3)]
+        assert items == ["marker", 2, 3]
+        assert log_queue.dropped == 3
+
+    def test_blocking_get_wakes_for_new_items(self):
+        """Test that a blocked consumer receives an item queued later."""
+        log_queue = _RingBufferQueue(10)
+        received = []
+        consumer = threading.Thread(target=lambda: received.append(log_queue.get()))
+        consumer.start()
+        log_queue.put_control("marker")
+        consumer.join(timeout=5)
+
+        assert not consumer.is_alive()
+        assert received == ["marker"]
+
+
+class TestQueueLogging:
+    """Test cases for the background queue listener."""
+
+    def test_flush_drains_queued_records(self, queued_root_logger):
+        """Test that a flush returns once every earlier record was handled."""
+        logger = logging.getLogger("mgit.test.queue")
+        for index in range(100):
+            logger.info("record %d", index)
+
+        assert flush_queue_logging(timeout=5)
+        assert queued_root_logger.messages == [f"record {i}" for i in range(100)]
+
+    def test_flush_returns_under_sustained_logging(self, queued_root_logger):
+        """Test that a flush is not starved by records logged after it."""
+        logger = logging.getLogger("mgit.test.queue")
+        stop = threading.Event()
+
+        def log_continuously():
+            while not stop.is_set():
+                logger.info("background")
+
+        producers = [threading.Thread(target=log_continuously) for _ in range(2)]
+        for producer in producers:
+            producer.start()
+        try:
+            assert flush_queue_logging(timeout=5)
+        finally:
+            stop.set()
+            for producer in producers:
+                producer.join()
+
+    def test_stop_drains_queued_records(self, queued_root_logger):
+        """Test that stopping handles every queued record and restores handlers."""
+        logger = logging.getLogger("mgit.test.queue")
+        for index in range(100):
+            logger.info("record %d", index)
+
+        stop_queue_logging()
+
+        assert queued_root_logger.messages == [f"record {i}" for i in range(100)]
+        assert logging.getLogger().handlers == [queued_root_logger]